@@ -1,30 +1,42 @@
 """Handler for downloading and managing Jira attachments."""
 
 import asyncio
+import json
 import logging
+import os
 from pathlib import Path
 
 from .exceptions import AttachmentDownloadError
 
+# Per-directory record of the local file name each attachment id was saved as
+MANIFEST_NAME = ".jarkdown-cache.json"
+
 
 class AttachmentHandler:
     """Manages downloading and saving of issue attachments."""
 
-    def __init__(self, api_client):
+    def __init__(self, api_client, skip_existing=False):
         """Initialize the attachment handler.
 
         Args:
             api_client: JiraApiClient instance for API communication
+            skip_existing: If True, reuse files saved by an earlier export of
+                the same attachment (matched by id and size) instead of
+                downloading them again
         """
         self.api_client = api_client
+        self.skip_existing = skip_existing
         self.logger = logging.getLogger(__name__)
 
-    async def download_attachment(self, attachment, output_dir):
+    async def download_attachment(self, attachment, output_dir, local_name=None):
         """Download a single attachment asynchronously.
 
         Args:
             attachment: Attachment metadata from Jira API
             output_dir: Directory to save the attachment to
+            local_name: File name reserved for this attachment. It is written
+                in place (and reused as-is when ``skip_existing`` is set and
+                the file is complete); without it a free name is chosen.
 
         Returns:
             dict: Information about the downloaded attachment including
@@ -38,34 +50,32 @@ class AttachmentHandler:
         mime_type = attachment.get("mimeType", "")
         size = attachment.get("size", 0)
 
-        file_path = output_dir / filename
-
-        # Handle filename conflicts (sync — just stat checks)
-        counter = 1
-        original_path = file_path
-        while file_path.exists():
-            stem = original_path.stem
-            suffix = original_path.suffix
-            file_path = original_path.parent / f"{stem}_{counter}{suffix}"
-            counter += 1
+        if local_name:
+            file_path = output_dir / local_name
+            # Reuse this attachment's file from a previous export
+            if self.skip_existing and self._is_already_downloaded(file_path, size):
+                self.logger.info("  Skipping %s (already downloaded)", filename)
+                return self._attachment_info(attachment, file_path, filename, mime_type)
+        else:
+            file_path = self._free_path(output_dir / filename)
 
-        self.logger.info(f"  Downloading {filename} ({self._format_size(size)})...")
+        self.logger.info("  Downloading %s (%s)...", filename, self._format_size(size))
 
         try:
-            response = await self.api_client.download_attachment_stream(content_url)
-            # Buffer entire attachment then write via thread to avoid blocking event loop
-            data = await response.read()
-            await asyncio.to_thread(file_path.write_bytes, data)
-
-            return {
-                "attachment_id": attachment.get("id"),
-                "filename": file_path.name,
-                "original_filename": filename,
-                "mime_type": mime_type,
-                "path": file_path,
-            }
+            # Write chunk by chunk via thread to avoid blocking the event loop
+            # without buffering the whole attachment in memory
+            f = await asyncio.to_thread(open, file_path, "wb")
+            try:
+                async for chunk in self.api_client.iter_attachment(content_url):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+
+            return self._attachment_info(attachment, file_path, filename, mime_type)
 
         except Exception as e:
+            # Don't leave a truncated file behind to be mistaken for a full copy
+            file_path.unlink(missing_ok=True)
             raise AttachmentDownloadError(
                 f"Error downloading {filename}: {e}", filename=filename
             )
@@ -73,6 +83,10 @@ class AttachmentHandler:
     async def download_all_attachments(self, attachments, output_dir):
         """Download all attachments for an issue asynchronously (sequential).
 
+        With ``skip_existing``, each attachment keeps the file name recorded
+        for its id in the directory's manifest, so re-exports overwrite or
+        reuse the same files instead of adding numbered copies.
+
         Args:
             attachments: List of attachment metadata from Jira API
             output_dir: Directory to save attachments to
@@ -86,20 +100,151 @@ class AttachmentHandler:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        self.logger.info(f"Downloading {len(attachments)} attachment(s)...")
+        self.logger.info("Downloading %d attachment(s)...", len(attachments))
+
+        if self.skip_existing:
+            manifest = await asyncio.to_thread(self._load_manifest, output_dir)
+            local_names = self._assign_local_names(attachments, output_dir, manifest)
+        else:
+            manifest = None
+            local_names = [None] * len(attachments)
 
         downloaded = []
-        for attachment in attachments:
+        for attachment, local_name in zip(attachments, local_names):
             try:
-                result = await self.download_attachment(attachment, output_dir)
+                result = await self.download_attachment(
+                    attachment, output_dir, local_name=local_name
+                )
                 if result:
                     downloaded.append(result)
             except AttachmentDownloadError as e:
                 self.logger.error(str(e))
                 # Continue downloading other attachments
 
+        if manifest is not None:
+            for result in downloaded:
+                if result["attachment_id"] is not None:
+                    manifest[str(result["attachment_id"])] = result["filename"]
+            await asyncio.to_thread(self._save_manifest, output_dir, manifest)
+
         return downloaded
 
+    def _assign_local_names(self, attachments, output_dir, manifest):
+        """Pick the local file name for each attachment before downloading.
+
+        Attachments recorded in the manifest keep their previous name; the
+        others get a name not used on disk or by another attachment.
+
+        Args:
+            attachments: List of attachment metadata from Jira API
+            output_dir: Directory the attachments are saved to
+            manifest: Dict mapping attachment id → previously used file name
+
+        Returns:
+            list: File name for each attachment, in the same order
+        """
+        ids = [a.get("id") for a in attachments]
+        ids = [None if i is None else str(i) for i in ids]
+        taken = {manifest[i] for i in ids if i in manifest}
+        names = []
+        for attachment, attachment_id in zip(attachments, ids):
+            name = manifest.get(attachment_id)
+            if name is None:
+                name = self._free_path(output_dir / attachment["filename"], taken).name
+                taken.add(name)
+            names.append(name)
+        return names
+
+    @staticmethod
+    def _free_path(file_path, taken=()):
+        """Return file_path, or a numbered variant if that name is in use.
+
+        Args:
+            file_path: Preferred target path
+            taken: File names reserved for other attachments
+
+        Returns:
+            Path: A path that neither exists nor uses a reserved name
+        """
+        counter = 1
+        original_path = file_path
+        while file_path.exists() or file_path.name in taken:
+            stem = original_path.stem
+            suffix = original_path.suffix
+            file_path = original_path.parent / f"{stem}_{counter}{suffix}"
+            counter += 1
+        return file_path
+
+    @staticmethod
+    def _load_manifest(output_dir):
+        """Read the attachment manifest of an output directory.
+
+        Args:
+            output_dir: Export directory of one issue
+
+        Returns:
+            dict: Attachment id → file name; empty if missing or unreadable
+        """
+        try:
+            data = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+            attachments = data["attachments"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        if not isinstance(attachments, dict):
+            return {}
+        # Only plain file names inside output_dir are honored
+        return {
+            str(k): v
+            for k, v in attachments.items()
+            if isinstance(v, str) and v and v == Path(v).name
+        }
+
+    def _save_manifest(self, output_dir, manifest):
+        """Atomically write the attachment manifest of an output directory.
+
+        Args:
+            output_dir: Export directory of one issue
+            manifest: Dict mapping attachment id → file name
+        """
+        path = output_dir / MANIFEST_NAME
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"attachments": manifest}, indent=2), encoding="utf-8"
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Failed to write attachment manifest: %s", e)
+
+    @staticmethod
+    def _attachment_info(attachment, file_path, filename, mime_type):
+        """Build the metadata dict describing a downloaded attachment."""
+        return {
+            "attachment_id": attachment.get("id"),
+            "filename": file_path.name,
+            "original_filename": filename,
+            "mime_type": mime_type,
+            "path": file_path,
+        }
+
+    @staticmethod
+    def _is_already_downloaded(file_path, size):
+        """Check whether file_path holds a complete copy of an attachment.
+
+        Args:
+            file_path: Local target path for the attachment
+            size: Attachment size in bytes as reported by Jira
+
+        Returns:
+            bool: True if the file exists and its size matches
+        """
+        if not size:
+            return False
+        try:
+            return file_path.is_file() and file_path.stat().st_size == size
+        except OSError:
+            return False
+
     def _format_size(self, size):
         """Format file size in human-readable format.
 
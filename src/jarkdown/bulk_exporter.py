@@ -3,21 +3,25 @@
 import asyncio
 import logging
 import sys
-from dataclasses import dataclass
+from operator import attrgetter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from .exceptions import AuthenticationError, IssueNotFoundError, JarkdownError
-from .export_core import perform_export
+from .export_core import perform_export, refresh_field_cache
 
 logger = logging.getLogger(__name__)
 
+_NO_DATA = {}  # shared read-only default for missing issue data and fields
 
-@dataclass
-class ExportResult:
+
+class ExportResult(NamedTuple):
     """Result of a single issue export attempt.
 
+    A named tuple rather than a dataclass: bulk exports keep one per issue,
+    and tuples carry no per-instance ``__dict__``.
+
     Attributes:
         issue_key: Jira issue key (e.g., 'PROJ-123')
         success: Whether the export succeeded
@@ -57,7 +61,11 @@ class BulkExporter:
         include_json: bool = False,
     ):
         self.api_client = api_client
-        self.semaphore = asyncio.Semaphore(concurrency)
+        # Running-export counter guarded by a condition, so the limit can be
+        # changed while an export is in progress (see set_concurrency)
+        self._concurrency = concurrency
+        self._active = 0
+        self._slots_changed = asyncio.Condition()
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         if batch_name:
             self.output_dir = self.output_dir / batch_name
@@ -66,10 +74,48 @@ class BulkExporter:
         self.exclude_fields = exclude_fields
         self.include_json = include_json
 
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of simultaneous exports."""
+        return self._concurrency
+
+    async def set_concurrency(self, concurrency: int) -> None:
+        """Change the maximum number of simultaneous exports.
+
+        Raising the limit lets waiting exports start immediately; lowering it
+        lets running exports finish and holds back new ones until the number
+        running drops below the new limit.
+
+        Args:
+            concurrency: New maximum, at least 1
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        async with self._slots_changed:
+            self._concurrency = concurrency
+            self._slots_changed.notify_all()
+
+    async def _take_slot(self) -> None:
+        """Wait until fewer than ``concurrency`` exports run, then claim a slot."""
+        async with self._slots_changed:
+            await self._slots_changed.wait_for(
+                lambda: self._active < self._concurrency
+            )
+            self._active += 1
+
+    async def _free_slot(self) -> None:
+        """Release a slot claimed by ``_take_slot`` and wake one waiter."""
+        async with self._slots_changed:
+            self._active -= 1
+            self._slots_changed.notify(1)
+
     async def export_bulk(
         self, issue_keys: List[str]
     ) -> Tuple[List[ExportResult], List[ExportResult]]:
-        """Export multiple issues concurrently with semaphore-limited concurrency.
+        """Export multiple issues concurrently, at most ``concurrency`` at a time.
 
         Args:
             issue_keys: List of Jira issue keys to export
@@ -77,56 +123,111 @@ class BulkExporter:
         Returns:
             Tuple of (successes, failures) — both are lists of ExportResult
         """
-        total = len(issue_keys)
-        tasks = [
-            self._export_one(key, i + 1, total) for i, key in enumerate(issue_keys)
-        ]
-        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-        print("", file=sys.stderr)  # newline after progress line
-
-        successes = []
-        failures = []
-        for i, result in enumerate(raw_results):
-            if isinstance(result, BaseException):
-                # Unexpected exception not caught by _export_one — defensive handling
-                failures.append(
-                    ExportResult(
-                        issue_key=issue_keys[i],
-                        success=False,
-                        error=str(result),
-                    )
-                )
-            elif result.success:
-                successes.append(result)
-            else:
-                failures.append(result)
 
+        async def keys():
+            for key in issue_keys:
+                yield key
+
+        return await self._export_all(keys(), len(issue_keys))
+
+    async def export_stream(
+        self, issue_keys: AsyncIterable[str]
+    ) -> Tuple[List[ExportResult], List[ExportResult]]:
+        """Export issues as their keys arrive, at most ``concurrency`` at a time.
+
+        Each key is scheduled as soon as the iterable yields it and a slot is
+        free, so exports of early search pages overlap with fetching later
+        ones. If the iterable raises, running exports are cancelled and the
+        error propagates.
+
+        Args:
+            issue_keys: Async iterable of Jira issue keys, e.g. from
+                ``JiraApiClient.iter_jql``
+
+        Returns:
+            Tuple of (successes, failures) — both are lists of ExportResult
+        """
+        return await self._export_all(issue_keys, None)
+
+    async def _export_all(
+        self, issue_keys: AsyncIterable[str], total: Optional[int]
+    ) -> Tuple[List[ExportResult], List[ExportResult]]:
+        """Run ``_export_one`` for each key, creating a task only once a slot is free.
+
+        Only the running exports exist as tasks, so memory grows with
+        ``concurrency`` and the number of results rather than with every
+        pending export.
+
+        Args:
+            issue_keys: Async iterable of Jira issue keys
+            total: Number of keys, or None if not known up front
+
+        Returns:
+            Tuple of (successes, failures) — both are lists of ExportResult
+        """
+        if self.refresh_fields:
+            # Refresh once for the batch rather than in every export
+            await refresh_field_cache(self.api_client, force=True)
+
+        results = []
+        running = set()
+
+        async def run(index, key):
+            try:
+                results[index] = await self._export_one(key, index + 1, total)
+            except Exception as e:
+                # Unexpected exception not caught by _export_one — defensive handling
+                results[index] = ExportResult(issue_key=key, success=False, error=str(e))
+            finally:
+                await self._free_slot()
+
+        try:
+            async for key in issue_keys:
+                await self._take_slot()
+                results.append(None)
+                task = asyncio.ensure_future(run(len(results) - 1, key))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            while running:
+                await asyncio.wait(running)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        if results:
+            print("", file=sys.stderr)  # newline after progress line
+
+        successes = [r for r in results if r.success]
+        failures = [r for r in results if not r.success]
         return successes, failures
 
-    async def _export_one(self, issue_key: str, n: int, total: int) -> ExportResult:
-        """Export a single issue under the shared semaphore.
+    async def _export_one(
+        self, issue_key: str, n: int, total: Optional[int]
+    ) -> ExportResult:
+        """Export a single issue, reporting failures as an ExportResult.
 
         Args:
             issue_key: Jira issue key to export
             n: 1-based position in the export batch (for progress display)
-            total: Total number of issues in the batch
+            total: Total number of issues in the batch, or None if not yet known
 
         Returns:
             ExportResult indicating success or failure
         """
-        async with self.semaphore:
-            print(
-                f"\rExporting {n}/{total}... ({issue_key})",
-                end="",
-                flush=True,
-                file=sys.stderr,
-            )
-            try:
-                return await self._do_export(issue_key)
-            except (IssueNotFoundError, AuthenticationError) as e:
-                return ExportResult(issue_key=issue_key, success=False, error=str(e))
-            except JarkdownError as e:
-                return ExportResult(issue_key=issue_key, success=False, error=str(e))
+        position = f"{n}/{total}" if total is not None else str(n)
+        print(
+            f"\rExporting {position}... ({issue_key})",
+            end="",
+            flush=True,
+            file=sys.stderr,
+        )
+        try:
+            return await self._do_export(issue_key)
+        except (IssueNotFoundError, AuthenticationError) as e:
+            return ExportResult(issue_key=issue_key, success=False, error=str(e))
+        except JarkdownError as e:
+            return ExportResult(issue_key=issue_key, success=False, error=str(e))
 
     async def _do_export(self, issue_key: str) -> ExportResult:
         """Perform the actual export workflow for a single issue.
@@ -147,7 +248,7 @@ class BulkExporter:
             self.api_client,
             issue_key,
             self.output_dir / issue_key,
-            refresh_fields=self.refresh_fields,
+            refresh_fields=False,  # refreshed once in _export_all
             include_fields=self.include_fields,
             exclude_fields=self.exclude_fields,
             include_json=self.include_json,
@@ -167,55 +268,68 @@ class BulkExporter:
         Returns:
             str: Markdown content for the index file
         """
+        return "".join(self._iter_index_lines(results, all_issues_data))
+
+    def _iter_index_lines(
+        self, results: List[ExportResult], all_issues_data: Dict
+    ) -> Iterator[str]:
+        """Yield the lines of index.md, each ending in a newline.
+
+        Args:
+            results: List of ExportResult instances (success and failure)
+            all_issues_data: Dict mapping issue key → Jira API issue data dict
+
+        Yields:
+            str: The header, then one table row per result sorted by key
+        """
         total = len(results)
         succeeded = sum(1 for r in results if r.success)
         failed = total - succeeded
         today = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
 
-        lines = [
-            "# Export Summary",
-            "",
-            f"Exported: {succeeded} of {total} issues | Date: {today} | Failed: {failed}",
-            "",
-            "| Key | Summary | Status | Type | Assignee | Result |",
-            "|-----|---------|--------|------|----------|--------|",
-        ]
+        yield "# Export Summary\n"
+        yield "\n"
+        yield f"Exported: {succeeded} of {total} issues | Date: {today} | Failed: {failed}\n"
+        yield "\n"
+        yield "| Key | Summary | Status | Type | Assignee | Result |\n"
+        yield "|-----|---------|--------|------|----------|--------|\n"
 
-        for result in sorted(results, key=lambda r: r.issue_key):
-            issue_data = all_issues_data.get(result.issue_key, {})
-            fields = issue_data.get("fields", {})
+        get_issue = all_issues_data.get
+        for result in sorted(results, key=attrgetter("issue_key")):
+            key = result.issue_key
+            fields = (get_issue(key) or _NO_DATA).get("fields") or _NO_DATA
 
             summary = fields.get("summary") or "-"
-            status = (fields.get("status") or {}).get("name", "-")
-            issue_type = (fields.get("issuetype") or {}).get("name", "-")
-            assignee_field = fields.get("assignee")
-            assignee = (
-                assignee_field.get("displayName", "-") if assignee_field else "-"
-            )
+            status = (fields.get("status") or _NO_DATA).get("name") or "-"
+            issue_type = (fields.get("issuetype") or _NO_DATA).get("name") or "-"
+            assignee = (fields.get("assignee") or _NO_DATA).get("displayName") or "-"
 
             if result.success:
-                key_link = f"[{result.issue_key}]({result.issue_key}/{result.issue_key}.md)"
+                key_link = f"[{key}]({key}/{key}.md)"
                 result_col = "✓"
             else:
-                key_link = f"[{result.issue_key}](#)"
+                key_link = f"[{key}](#)"
                 result_col = f"✗ {result.error or 'Unknown error'}"
 
-            lines.append(
-                f"| {key_link} | {summary} | {status} | {issue_type} | {assignee} | {result_col} |"
-            )
-
-        return "\n".join(lines) + "\n"
+            yield f"| {key_link} | {summary} | {status} | {issue_type} | {assignee} | {result_col} |\n"
 
     async def write_index_md(
         self, results: List[ExportResult], issues_data: Dict
     ) -> None:
         """Write index.md to the output directory.
 
+        Rows are written as they are generated, so the full table is never
+        held in memory for large exports.
+
         Args:
             results: List of ExportResult instances
             issues_data: Dict mapping issue key → Jira API issue data dict
         """
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        content = self.generate_index_md(results, issues_data)
         index_path = self.output_dir / "index.md"
-        await asyncio.to_thread(index_path.write_text, content, encoding="utf-8")
+
+        def _write():
+            with open(index_path, "w", encoding="utf-8") as f:
+                f.writelines(self._iter_index_lines(results, issues_data))
+
+        await asyncio.to_thread(_write)
@@ -4,39 +4,51 @@
 class JarkdownError(Exception):
     """Base exception for all jarkdown errors."""
 
-    pass
+    __slots__ = ()
 
 
 class JiraApiError(JarkdownError):
     """Raised when there's an error communicating with the Jira API."""
 
+    __slots__ = ("status_code", "response")
+
     def __init__(self, message, status_code=None, response=None):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
 
+    def __reduce__(self):
+        # Slot values aren't part of BaseException's pickled state
+        return type(self), (*self.args, self.status_code, self.response)
+
 
 class AuthenticationError(JiraApiError):
     """Raised when authentication with Jira fails."""
 
-    pass
+    __slots__ = ()
 
 
 class IssueNotFoundError(JiraApiError):
     """Raised when the requested issue is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class AttachmentDownloadError(JarkdownError):
     """Raised when there's an error downloading an attachment."""
 
+    __slots__ = ("filename",)
+
     def __init__(self, message, filename=None):
         super().__init__(message)
         self.filename = filename
 
+    def __reduce__(self):
+        # Slot values aren't part of BaseException's pickled state
+        return type(self), (*self.args, self.filename)
+
 
 class ConfigurationError(JarkdownError):
     """Raised when there's a configuration problem."""
 
-    pass
+    __slots__ = ()
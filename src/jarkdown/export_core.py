@@ -3,6 +3,8 @@
 import asyncio
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 
 from .attachment_handler import AttachmentHandler
@@ -12,6 +14,14 @@ from .markdown_converter import MarkdownConverter
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Mode open() would give a new file under the current umask (which can only
+# be read by setting it, so do that once at import rather than per thread)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_MD_FILE_MODE = 0o666 & ~_UMASK
+
 
 async def perform_export(
     api_client,
@@ -52,25 +62,29 @@ async def perform_export(
     # Ensure output directory exists
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Fetch issue data
-    issue_data = await api_client.fetch_issue(issue_key)
+    async def fetch_issue_and_attachments():
+        issue_data = await api_client.fetch_issue(issue_key)
+        attachment_handler = AttachmentHandler(api_client, skip_existing=True)
+        attachments = issue_data.get("fields", {}).get("attachment", [])
+        downloaded_attachments = await attachment_handler.download_all_attachments(
+            attachments, output_path
+        )
+        return issue_data, downloaded_attachments
 
-    # Download attachments
-    attachment_handler = AttachmentHandler(api_client)
-    attachments = issue_data.get("fields", {}).get("attachment", [])
-    downloaded_attachments = await attachment_handler.download_all_attachments(
-        attachments, output_path
+    # The field metadata refresh doesn't depend on the issue, so it runs
+    # while the issue and its attachments download
+    tasks = (
+        asyncio.ensure_future(fetch_issue_and_attachments()),
+        asyncio.ensure_future(refresh_field_cache(api_client, force=refresh_fields)),
     )
-
-    # Build field metadata cache
-    field_cache = FieldMetadataCache(api_client.domain)
-    if refresh_fields or field_cache.is_stale():
-        try:
-            fields = await api_client.fetch_fields()
-            field_cache.save(fields)
-            logger.info("Field metadata cached (%d fields)", len(fields))
-        except Exception as exc:
-            logger.warning("Failed to refresh field metadata: %s", exc)
+    try:
+        (issue_data, downloaded_attachments), field_cache = await asyncio.gather(*tasks)
+    except BaseException:
+        # Don't leave the other request running once the export has failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
     # Build field filter from config / CLI overrides
     config_manager = ConfigManager()
@@ -79,14 +93,7 @@ async def perform_export(
         cli_exclude=exclude_fields,
     )
 
-    # Convert to Markdown
     markdown_converter = MarkdownConverter(api_client.base_url, api_client.domain)
-    markdown_content = markdown_converter.compose_markdown(
-        issue_data,
-        downloaded_attachments,
-        field_cache=field_cache,
-        field_filter=field_filter,
-    )
 
     # Write raw JSON (opt-in)
     if include_json:
@@ -97,8 +104,75 @@ async def perform_export(
             "utf-8",
         )
 
-    # Write Markdown
+    # Convert to Markdown, streaming sections straight to disk
     md_file = output_path / f"{issue_key}.md"
-    await asyncio.to_thread(md_file.write_text, markdown_content, "utf-8")
+    await asyncio.to_thread(
+        _write_markdown,
+        md_file,
+        markdown_converter,
+        issue_data,
+        downloaded_attachments,
+        field_cache,
+        field_filter,
+    )
 
     return output_path
+
+
+async def refresh_field_cache(api_client, force: bool = False) -> FieldMetadataCache:
+    """Load the field metadata cache, refreshing it from Jira if stale or forced.
+
+    Args:
+        api_client: Active JiraApiClient instance.
+        force: Refresh even if the cached metadata is still fresh.
+
+    Returns:
+        FieldMetadataCache: Cache for ``api_client.domain``. If the refresh
+        fails, the stale cache (possibly empty) is returned and a warning is
+        logged.
+    """
+    field_cache = FieldMetadataCache(api_client.domain)
+    if force or field_cache.is_stale():
+        try:
+            fields = await api_client.get_fields()
+            field_cache.save(fields)
+            logger.info("Field metadata cached (%d fields)", len(fields))
+        except Exception as exc:
+            logger.warning("Failed to refresh field metadata: %s", exc)
+    return field_cache
+
+
+def _write_markdown(
+    md_file, markdown_converter, issue_data, downloaded_attachments, field_cache, field_filter
+):
+    """Compose the Markdown for an issue and move it into place at ``md_file``.
+
+    Runs in a worker thread so neither composition nor disk I/O blocks the
+    event loop. The Markdown is streamed into a temporary file next to
+    ``md_file`` and only replaces it once composition succeeds, so a failed
+    re-export keeps the previous file intact.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        buffering=_WRITE_BUFFER_SIZE,
+        dir=md_file.parent,
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp as f:
+            markdown_converter.compose_markdown_into(
+                f,
+                issue_data,
+                downloaded_attachments,
+                field_cache=field_cache,
+                field_filter=field_filter,
+            )
+        # NamedTemporaryFile creates the file as 0600; give the export the
+        # same permissions a plain open() would
+        os.chmod(tmp.name, _MD_FILE_MODE)
+        os.replace(tmp.name, md_file)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
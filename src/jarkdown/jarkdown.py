@@ -18,7 +18,13 @@ from getpass import getpass
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Optional: pip install jarkdown[fast]
+    uvloop = None
+
 from .jira_api_client import JiraApiClient
+from .response_cache import ResponseCache
 from .bulk_exporter import BulkExporter
 from .export_core import perform_export
 from .exceptions import (
@@ -26,6 +32,7 @@ from .exceptions import (
 )
 
 _ISSUE_KEY_RE = re.compile(r"^[A-Z]+-\d+$")
+_CREDENTIAL_VARS = ("JIRA_DOMAIN", "JIRA_EMAIL", "JIRA_API_TOKEN")
 
 
 def get_version():
@@ -36,6 +43,41 @@ def get_version():
         return "unknown"
 
 
+def _non_negative_int(value):
+    """Parse a CLI argument as an integer that is zero or greater.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        int: Parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer or is negative
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
+def _run_async(coro):
+    """Run a coroutine to completion on uvloop if installed, else asyncio.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def setup_configuration():
     """Interactive setup to create .env file with Jira credentials."""
     print("\n=== Jarkdown Configuration Setup ===")
@@ -142,6 +184,23 @@ async def export_issue(api_client, issue_key, output_dir=None,
     return output_path
 
 
+def _make_client(args, domain, email, api_token):
+    """Create the API client, with a response cache if --cache-ttl is set.
+
+    Args:
+        args: Parsed CLI arguments
+        domain: Jira domain from environment
+        email: Jira email from environment
+        api_token: Jira API token from environment
+
+    Returns:
+        JiraApiClient: Client ready to be entered as an async context manager
+    """
+    cache_ttl = getattr(args, "cache_ttl", 0)
+    response_cache = ResponseCache(domain, email, cache_ttl) if cache_ttl else None
+    return JiraApiClient(domain, email, api_token, response_cache=response_cache)
+
+
 async def _async_export(args, domain, email, api_token):
     """Async inner function for the export subcommand.
 
@@ -151,7 +210,7 @@ async def _async_export(args, domain, email, api_token):
         email: Jira email from environment
         api_token: Jira API token from environment
     """
-    async with JiraApiClient(domain, email, api_token) as client:
+    async with _make_client(args, domain, email, api_token) as client:
         await export_issue(
             client,
             args.issue_key,
@@ -172,15 +231,16 @@ def _load_credentials():
     Exits:
         sys.exit(1) if credentials are missing or .env file not found
     """
-    load_dotenv()
+    # Only read .env when the environment doesn't already provide everything
+    if not all(os.getenv(name) for name in _CREDENTIAL_VARS):
+        load_dotenv()
 
     domain = os.getenv("JIRA_DOMAIN")
     email = os.getenv("JIRA_EMAIL")
     api_token = os.getenv("JIRA_API_TOKEN")
 
     # Check if .env file exists and no environment variables are set
-    env_path = Path.cwd() / ".env"
-    if not env_path.exists() and not all([domain, email, api_token]):
+    if not all([domain, email, api_token]) and not (Path.cwd() / ".env").exists():
         print("Error: Configuration file '.env' not found.")
         print("\nTo set up your configuration, run: jarkdown setup")
         print("Or create a .env file manually with:")
@@ -242,7 +302,7 @@ def _handle_export(args):
 
     try:
         domain, email, api_token = _load_credentials()
-        asyncio.run(_async_export(args, domain, email, api_token))
+        _run_async(_async_export(args, domain, email, api_token))
 
     except JarkdownError as e:
         # Catch all JarkdownError subclasses with a single handler
@@ -264,7 +324,7 @@ def _handle_bulk(args):
     """
     try:
         domain, email, api_token = _load_credentials()
-        asyncio.run(_async_bulk(args, domain, email, api_token))
+        _run_async(_async_bulk(args, domain, email, api_token))
     except JarkdownError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -287,7 +347,7 @@ async def _async_bulk(args, domain, email, api_token):
         email: Jira email from environment
         api_token: Jira API token from environment
     """
-    async with JiraApiClient(domain, email, api_token) as client:
+    async with _make_client(args, domain, email, api_token) as client:
         exporter = BulkExporter(
             client,
             concurrency=args.concurrency,
@@ -313,7 +373,7 @@ def _handle_query(args):
     """
     try:
         domain, email, api_token = _load_credentials()
-        asyncio.run(_async_query(args, domain, email, api_token))
+        _run_async(_async_query(args, domain, email, api_token))
     except JarkdownError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -336,14 +396,16 @@ async def _async_query(args, domain, email, api_token):
         email: Jira email from environment
         api_token: Jira API token from environment
     """
-    async with JiraApiClient(domain, email, api_token) as client:
+    async with _make_client(args, domain, email, api_token) as client:
         print(f"Searching: {args.jql}", file=sys.stderr)
-        issues = await client.search_jql(args.jql, max_results=args.max_results)
-        if not issues:
-            print("No issues found.", file=sys.stderr)
-            return
-        issue_keys = [i["key"] for i in issues]
-        print(f"Found {len(issue_keys)} issues.", file=sys.stderr)
+        issues_data = {}
+
+        async def matching_keys():
+            # Export each page of results while the next one is fetched
+            async for issue in client.iter_jql(args.jql, max_results=args.max_results):
+                issues_data[issue["key"]] = issue
+                yield issue["key"]
+
         exporter = BulkExporter(
             client,
             concurrency=args.concurrency,
@@ -351,8 +413,10 @@ async def _async_query(args, domain, email, api_token):
             batch_name=getattr(args, "batch_name", None),
             include_json=getattr(args, "include_json", False),
         )
-        successes, failures = await exporter.export_bulk(issue_keys)
-        issues_data = {i["key"]: i for i in issues}
+        successes, failures = await exporter.export_stream(matching_keys())
+        if not issues_data:
+            print("No issues found.", file=sys.stderr)
+            return
         await exporter.write_index_md(successes + failures, issues_data)
         _print_summary(successes, failures)
         if failures:
@@ -378,6 +442,14 @@ def main():
         action="store_true",
         help="Force refresh of cached Jira field metadata",
     )
+    parent_parser.add_argument(
+        "--cache-ttl",
+        type=_non_negative_int,
+        default=0,
+        metavar="SECONDS",
+        help="Reuse issue data fetched within the last SECONDS instead of "
+        "requesting it again (default: 0, disabled)",
+    )
     parent_parser.add_argument(
         "--include-fields",
         help="Comma-separated list of custom field names to include",
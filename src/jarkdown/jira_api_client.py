@@ -2,22 +2,52 @@
 
 import asyncio
 import logging
+import time
 
 import aiohttp
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional: pip install jarkdown[fast]
+    from json import loads as _json_loads
+
 from .exceptions import JiraApiError, AuthenticationError, IssueNotFoundError
+from .retry import retry_with_backoff, DEFAULT_RETRY, HostTokenBucket
+
+ATTACHMENT_CHUNK_SIZE = 1 << 20  # 1 MiB
+CONNECTIONS_PER_HOST = 5
+FIELDS_TTL_SECONDS = 600  # reuse of field definitions within one client
+SEARCH_JQL_FIELDS = "summary,issuetype,status,assignee"
 
 
 class JiraApiClient:
     """Handles all communication with the Jira Cloud REST API using async aiohttp."""
 
-    def __init__(self, domain, email, api_token):
+    __slots__ = (
+        "domain",
+        "email",
+        "api_token",
+        "base_url",
+        "api_base",
+        "session",
+        "retry_limiter",
+        "request_slots",
+        "response_cache",
+        "_fields",
+        "_fields_fetched_at",
+        "_fields_lock",
+        "logger",
+    )
+
+    def __init__(self, domain, email, api_token, response_cache=None):
         """Initialize the Jira API client.
 
         Args:
             domain: Jira domain (e.g., 'company.atlassian.net')
             email: User email for authentication
             api_token: API token for authentication
+            response_cache: Optional ResponseCache consulted by fetch_issue
+                before requesting the issue from Jira
         """
         self.domain = domain
         self.email = email
@@ -25,6 +55,15 @@ class JiraApiClient:
         self.base_url = f"https://{domain}"
         self.api_base = f"{self.base_url}/rest/api/3"
         self.session = None
+        # Paces retries from all concurrent requests to this Jira host
+        self.retry_limiter = HostTokenBucket.from_config(DEFAULT_RETRY)
+        # Caps requests in flight or waiting to retry; created with the session
+        self.request_slots = None
+        self.response_cache = response_cache
+        # Field definitions shared by every export made through this client
+        self._fields = None
+        self._fields_fetched_at = 0.0
+        self._fields_lock = None
 
         self.logger = logging.getLogger(__name__)
 
@@ -34,7 +73,15 @@ class JiraApiClient:
         Returns:
             JiraApiClient: Self with active session
         """
-        connector = aiohttp.TCPConnector(limit_per_host=5)
+        # One session serves every request made through this client, so keep
+        # its pooled connections and the host's DNS entry for a whole run
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CONNECTIONS_PER_HOST,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+        self.request_slots = asyncio.Semaphore(CONNECTIONS_PER_HOST)
+        self._fields_lock = asyncio.Lock()
         auth = aiohttp.BasicAuth(self.email, self.api_token)
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
@@ -67,12 +114,28 @@ class JiraApiClient:
         url = f"{self.api_base}/issue/{issue_key}"
         params = {"fields": "*all", "expand": "renderedFields"}
 
-        self.logger.info(f"Fetching issue {issue_key}...")
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.key("GET", url, params)
+            cached = await asyncio.to_thread(self.response_cache.get, cache_key)
+            if cached is not None:
+                self.logger.info("Using cached response for issue %s", issue_key)
+                return cached
+
+        self.logger.info("Fetching issue %s...", issue_key)
+
+        async def _fetch():
+            async with self.session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json(loads=_json_loads)
 
         try:
-            response = await self.session.get(url, params=params)
-            response.raise_for_status()
-            return await response.json()
+            issue_data = await retry_with_backoff(
+                _fetch,
+                config=DEFAULT_RETRY,
+                limiter=self.retry_limiter,
+                semaphore=self.request_slots,
+            )
 
         except aiohttp.ClientResponseError as e:
             if e.status == 401:
@@ -94,6 +157,10 @@ class JiraApiClient:
         except aiohttp.ClientError as e:
             raise JiraApiError(f"Error fetching issue: {e}")
 
+        if cache_key is not None:
+            await asyncio.to_thread(self.response_cache.set, cache_key, issue_data)
+        return issue_data
+
     async def fetch_fields(self):
         """Fetch all field definitions from Jira.
 
@@ -107,10 +174,18 @@ class JiraApiClient:
         url = f"{self.api_base}/field"
         self.logger.info("Fetching field metadata...")
 
+        async def _fetch():
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                return await response.json(loads=_json_loads)
+
         try:
-            response = await self.session.get(url)
-            response.raise_for_status()
-            return await response.json()
+            return await retry_with_backoff(
+                _fetch,
+                config=DEFAULT_RETRY,
+                limiter=self.retry_limiter,
+                semaphore=self.request_slots,
+            )
 
         except aiohttp.ClientResponseError as e:
             if e.status == 401:
@@ -126,6 +201,29 @@ class JiraApiClient:
         except aiohttp.ClientError as e:
             raise JiraApiError(f"Error fetching field metadata: {e}")
 
+    async def get_fields(self):
+        """Return field definitions, fetching them at most once per TTL.
+
+        Every export in a bulk run needs the same field metadata; concurrent
+        callers wait for a single request and later ones reuse its result
+        for ``FIELDS_TTL_SECONDS``.
+
+        Returns:
+            list: List of field definition dicts with id, name, schema keys.
+
+        Raises:
+            AuthenticationError: If authentication fails
+            JiraApiError: If the API call fails.
+        """
+        async with self._fields_lock:
+            if (
+                self._fields is None
+                or time.monotonic() - self._fields_fetched_at > FIELDS_TTL_SECONDS
+            ):
+                self._fields = await self.fetch_fields()
+                self._fields_fetched_at = time.monotonic()
+            return self._fields
+
     async def search_jql(self, jql: str, max_results: int = 50) -> list:
         """Search for issues matching a JQL query, paginating via nextPageToken.
 
@@ -140,30 +238,47 @@ class JiraApiClient:
             JiraApiError: If any API call fails
             AuthenticationError: On 401
         """
-        from .retry import retry_with_backoff, DEFAULT_RETRY
+        return [issue async for issue in self.iter_jql(jql, max_results)]
 
+    async def iter_jql(self, jql: str, max_results: int = 50):
+        """Yield issues matching a JQL query as each page arrives.
+
+        Lets callers start work on the first page while later pages are
+        still being requested, without holding the whole result set.
+
+        Args:
+            jql: JQL query string (e.g., 'project = FOO AND status = Done')
+            max_results: Maximum total issues to yield across all pages.
+
+        Yields:
+            dict: Issue data from Jira API (keys, fields — light-weight summary data)
+
+        Raises:
+            JiraApiError: If any API call fails
+            AuthenticationError: On 401
+        """
         url = f"{self.api_base}/search/jql"
-        issues = []
-        next_page_token = None
+        yielded = 0
         page_size = min(max_results, 50)
+        # Built once; each page only updates maxResults and nextPageToken
+        params = {"jql": jql, "fields": SEARCH_JQL_FIELDS}
+
+        async def _fetch_page():
+            async with self.session.get(url, params=params) as resp:
+                resp.raise_for_status()
+                return await resp.json(loads=_json_loads)
 
-        while len(issues) < max_results:
-            remaining = max_results - len(issues)
-            params = {
-                "jql": jql,
-                "maxResults": min(remaining, page_size),
-                "fields": "summary,issuetype,status,assignee",
-            }
-            if next_page_token:
-                params["nextPageToken"] = next_page_token
-
-            async def _fetch_page():
-                async with self.session.get(url, params=params) as resp:
-                    resp.raise_for_status()
-                    return await resp.json()
+        while yielded < max_results:
+            remaining = max_results - yielded
+            params["maxResults"] = min(remaining, page_size)
 
             try:
-                data = await retry_with_backoff(_fetch_page, config=DEFAULT_RETRY)
+                data = await retry_with_backoff(
+                    _fetch_page,
+                    config=DEFAULT_RETRY,
+                    limiter=self.retry_limiter,
+                    semaphore=self.request_slots,
+                )
             except aiohttp.ClientResponseError as e:
                 if e.status == 401:
                     raise AuthenticationError(
@@ -175,13 +290,14 @@ class JiraApiClient:
                 )
 
             page_issues = data.get("issues", [])
-            issues.extend(page_issues)
+            for issue in page_issues[:remaining]:
+                yield issue
+            yielded += min(len(page_issues), remaining)
 
             next_page_token = data.get("nextPageToken")
             if not next_page_token or not page_issues:
                 break
-
-        return issues[:max_results]
+            params["nextPageToken"] = next_page_token
 
     def get_attachment_content_url(self, attachment):
         """Get the download URL for an attachment.
@@ -214,3 +330,28 @@ class JiraApiClient:
             raise JiraApiError(f"Error downloading attachment: HTTP {e.status}")
         except aiohttp.ClientError as e:
             raise JiraApiError(f"Error downloading attachment: {e}")
+
+    async def iter_attachment(self, content_url, chunk_size=ATTACHMENT_CHUNK_SIZE):
+        """Stream an attachment body in fixed-size chunks.
+
+        Large chunks keep the number of Python-level reads per megabyte low,
+        which matters for big image and video attachments.
+
+        Args:
+            content_url: The URL to download the attachment from
+            chunk_size: Maximum number of bytes yielded per chunk (default: 1 MiB)
+
+        Yields:
+            bytes: Consecutive chunks of the attachment body
+
+        Raises:
+            JiraApiError: If download fails
+        """
+        response = await self.download_attachment_stream(content_url)
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+        except aiohttp.ClientError as e:
+            raise JiraApiError(f"Error downloading attachment: {e}")
+        finally:
+            response.release()
@@ -1,32 +1,342 @@
 """Converter for transforming Jira issues to Markdown format."""
 
+import io
 import re
-import yaml
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from urllib.parse import quote
-from markdownify import markdownify as md
+
+from .custom_field_renderer import CustomFieldRenderer
+from .simple_html import convert_simple_html
+
+try:
+    from html_to_markdown import ConversionOptions, convert as _html_to_markdown
+except ImportError:  # Optional: pip install jarkdown[fast]
+    _html_to_markdown = None
+else:
+    # Matches markdownify's output for the options convert_html_to_markdown uses
+    _HTML_TO_MARKDOWN_OPTIONS = ConversionOptions(
+        heading_style="atx",
+        bullets="*-+",
+        code_block_style="backticks",
+        escape_asterisks=True,
+        escape_underscores=True,
+    )
+
+# yaml and markdownify are imported on first use: markdownify pulls in
+# BeautifulSoup, which dominates import time, and many exports need neither
+
+_RE_THUMBNAIL_WRAPPER = re.compile(
+    r"<jira-attachment-thumbnail[^>]*>(.*?)</jira-attachment-thumbnail>",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_ANCHOR_IMG = re.compile(r"<a\b[^>]*>\s*(<img\b[^>]*>)\s*</a>", re.IGNORECASE | re.DOTALL)
+_RE_RESIDUAL_TAG = re.compile(r"<[^>]+>")
+_RE_MULTI_NL = re.compile(r"\n{3,}")
+# Characters quote() never escapes
+_RE_URL_SAFE = re.compile(r"[A-Za-z0-9_.~\-]+")
+# Strings PyYAML emits unquoted (unless they resolve to another type):
+# no indicators, quotes, hashes, "key: value" colons, doubled or edge spaces,
+# or non-ASCII
+_RE_YAML_PLAIN = re.compile(
+    r"[A-Za-z0-9_](?:[A-Za-z0-9_.+\-/()]|:(?=[A-Za-z0-9_.+\-/()])| (?! ))*(?<! )"
+)
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+# PyYAML's default line width; longer plain scalars get folded
+_YAML_WIDTH = 80
+# Lines placed between consecutive comments
+_COMMENT_SEP = ("", "---", "")
+# Issues kept by MarkdownConverter(cache_output=True)
+_COMPOSE_CACHE_SIZE = 256
+# Longest HTML whose conversion is kept in _convert_html_cached
+_HTML_CACHE_MAX_LENGTH = 8192
+# datetime.fromisoformat accepts "Z" and "+HHMM" offsets from Python 3.11
+_FROMISOFORMAT_PARSES_OFFSETS = sys.version_info >= (3, 11)
+# Stand-in for a missing ADF "attrs" object; only ever read, never mutated
+_EMPTY_ATTRS = {}
+
+
+def _quote_filename(filename):
+    """URL-encode a filename for a Markdown link, like ``quote(filename, safe="")``.
+
+    Most attachment names (``image-20250101-123456.png``) need no escaping,
+    so those skip ``quote`` and are returned as they are.
+
+    Args:
+        filename: Filename to encode
+
+    Returns:
+        str: The URL-encoded filename
+    """
+    if _RE_URL_SAFE.fullmatch(filename):
+        return filename
+    return quote(filename, safe="")
+
+
+@lru_cache(maxsize=None)
+def _yaml_implicit_tag():
+    """Return PyYAML's implicit scalar resolver, importing PyYAML on first use.
+
+    Returns:
+        callable: ``f(value, implicit)`` giving the tag PyYAML resolves a
+            plain scalar to
+    """
+    import yaml
+
+    return partial(yaml.resolver.Resolver().resolve, yaml.ScalarNode)
+
+
+def _yaml_plain(value, indent_width):
+    """Return True if PyYAML would emit ``value`` as an unquoted one-liner.
+
+    Args:
+        value: String to check
+        indent_width: Columns used on the line before the value
+
+    Returns:
+        bool: Whether ``value`` can be written as-is
+    """
+    return (
+        len(value) + indent_width <= _YAML_WIDTH
+        and _RE_YAML_PLAIN.fullmatch(value) is not None
+        and _yaml_implicit_tag()(value, (True, False)) == _YAML_STR_TAG
+    )
+
+
+def _dump_simple_yaml(metadata):
+    """Serialize frontmatter metadata exactly as ``yaml.dump`` would.
+
+    Handles the shapes ``_generate_metadata_dict`` produces (None, ints,
+    plain strings and lists of plain strings) directly. Any other entry, such
+    as a summary that needs quoting, is passed to ``yaml.dump`` on its own.
+
+    Args:
+        metadata: Mapping of frontmatter keys to values
+
+    Returns:
+        str: YAML block mapping, one entry per key, in insertion order
+    """
+    parts = []
+    for key, value in metadata.items():
+        width = len(key) + 2
+        if not _yaml_plain(key, 0):
+            entry = None
+        elif value is None:
+            entry = f"{key}: null\n"
+        elif type(value) is int:
+            entry = f"{key}: {value}\n"
+        elif type(value) is str and _yaml_plain(value, width):
+            entry = f"{key}: {value}\n"
+        elif type(value) is list:
+            if not value:
+                entry = f"{key}: []\n"
+            elif all(type(item) is str and _yaml_plain(item, 2) for item in value):
+                entry = f"{key}:\n" + "".join(f"- {item}\n" for item in value)
+            else:
+                entry = None
+        else:
+            entry = None
+
+        if entry is None:
+            import yaml
+
+            entry = yaml.dump(
+                {key: value}, default_flow_style=False, allow_unicode=True, sort_keys=False
+            )
+        parts.append(entry)
+    return "".join(parts)
+
+
+# Secure-URL filenames may contain balanced parentheses, e.g. "report (1).pdf".
+# Brackets are excluded so an unknown name can't run on into the next link
+_ATTACHMENT_FNAME = r"[^()\[\]\n]*(?:\([^()\[\]\n]*\)[^()\[\]\n]*)*"
+_RE_ATTACHMENT_FNAME = re.compile(_ATTACHMENT_FNAME)
+
+
+@lru_cache(maxsize=32)
+def _build_attachment_patterns(domain, secure_filenames=()):
+    """Compile the attachment-link regexes used by ``replace_attachment_links``.
+
+    The patterns only depend on the Jira domain, so they are cached at module
+    level and shared by the per-issue converters; attachments are resolved
+    from the ``id``/``fname`` groups by dictionary lookup.
+
+    Args:
+        domain: Jira domain (e.g., 'company.atlassian.net')
+        secure_filenames: Filenames the secure-URL branch matches literally,
+            for issues whose attachment names (unbalanced parentheses,
+            brackets) the generic filename pattern can't match. Empty to use
+            the generic pattern.
+
+    Returns:
+        tuple: ``(link_pattern, generic_url_pattern)``. ``link_pattern`` has
+            ``pre``/``text`` groups for the image or link prefix, ``url`` for
+            the whole URL, and ``id`` or ``fname`` for the part identifying
+            the attachment. ``generic_url_pattern`` matches the REST URLs
+            whose link text is used as the filename when the id isn't a
+            downloaded attachment.
+    """
+    optional_domain = f"(?:https?://{re.escape(domain)})?"
+    rest_prefix = f"{optional_domain}/(?:jira/)?rest/api/[0-9]+/attachment"
+    secure_prefix = f"{optional_domain}/secure/attachment"
+    if secure_filenames:
+        # Longest first, so a name isn't cut short by another that prefixes it
+        fname = "|".join(
+            re.escape(name) for name in sorted(secure_filenames, key=len, reverse=True)
+        )
+    else:
+        fname = _ATTACHMENT_FNAME
+    # Link text can't contain "[", so a stray bracket earlier in the text
+    # (or in a previous comment) never becomes the start of a link
+    link_pattern = re.compile(
+        r"(?P<pre>!?\[(?P<text>[^\[\]]*)\])\((?P<url>"
+        rf"{rest_prefix}/(?:content|thumbnail)/(?P<id>[0-9]+)"
+        rf"|{secure_prefix}/[0-9]+/(?P<fname>{fname})"
+        r")\)"
+    )
+    generic_url_pattern = re.compile(
+        "|".join(
+            (
+                f"{optional_domain}/jira/rest/api/[0-9]+/attachment/content/[0-9]+",
+                f"{optional_domain}/rest/api/[0-9]+/attachment/content/[0-9]+",
+                f"{optional_domain}/jira/rest/api/[0-9]+/attachment/thumbnail/[0-9]+",
+            )
+        )
+    )
+    return link_pattern, generic_url_pattern
+
+
+def _convert_html(html_content):
+    """Convert non-empty HTML to Markdown for ``convert_html_to_markdown``.
+
+    Args:
+        html_content: HTML string to convert
+
+    Returns:
+        str: Converted markdown content
+    """
+    # Plain paragraphs (most comments) don't need markdownify
+    markdown = convert_simple_html(html_content)
+    if markdown is not None:
+        return markdown
+
+    # Remove Atlassian-specific wrappers around images to keep plain Markdown embeds
+    html_content = _RE_THUMBNAIL_WRAPPER.sub(r"\1", html_content)
+    html_content = _RE_ANCHOR_IMG.sub(r"\1", html_content)
+
+    # Convert HTML to Markdown, with the Rust converter when it is installed
+    if _html_to_markdown is not None:
+        markdown = _html_to_markdown(html_content, _HTML_TO_MARKDOWN_OPTIONS).content
+    else:
+        from markdownify import markdownify as md
+
+        markdown = md(html_content, heading_style="ATX", bullets="*-+")
+
+    # Clean up any residual HTML tags that weren't converted
+    # (rare after markdownify, so skip the regex when there is no "<")
+    if "<" in markdown:
+        markdown = _RE_RESIDUAL_TAG.sub("", markdown)
+
+    # Clean up excessive whitespace. Each replace shrinks a run of newlines
+    # by a third, so a few passes settle realistic input; anything still
+    # left after that is collapsed by the regex
+    for _ in range(8):
+        if "\n\n\n" not in markdown:
+            break
+        markdown = markdown.replace("\n\n\n", "\n\n")
+    else:
+        markdown = _RE_MULTI_NL.sub("\n\n", markdown)
+
+    return markdown.strip()
+
+
+_convert_html_cached = lru_cache(maxsize=256)(_convert_html)
+
+
+@lru_cache(maxsize=1024)
+def _format_iso_date(created):
+    """Format a Jira ISO 8601 timestamp for display.
+
+    '2025-08-16T10:30:00.000+0000' -> '2025-08-16 10:30 AM'. Cached because the
+    same timestamps recur across comments and exports.
+
+    Args:
+        created: Timestamp string from the Jira API
+
+    Returns:
+        str: Formatted date, or the input unchanged if it cannot be parsed
+    """
+    try:
+        # Python 3.11+ parses "Z" and "+0000" offsets itself
+        if not _FROMISOFORMAT_PARSES_OFFSETS:
+            if created.endswith("Z"):
+                created = created[:-1] + "+00:00"
+            elif "+" in created and not created.endswith("+00:00"):
+                # Replace +0000 with +00:00
+                created = created.replace("+0000", "+00:00")
+
+        dt = datetime.fromisoformat(created)
+        return dt.strftime("%Y-%m-%d %I:%M %p")
+    except Exception:
+        return created
 
 
 class MarkdownConverter:
     """Converts Jira issue data into Markdown format."""
 
-    def __init__(self, base_url, domain):
+    __slots__ = (
+        "base_url",
+        "domain",
+        "_compose_cache",
+        "_downloaded_attachments",
+        "_attachment_index",
+        "_adf_markdown_cache",
+        "_adf_text_cache",
+        "_attachment_link_pattern",
+        "_generic_url_pattern",
+    )
+
+    def __init__(self, base_url, domain, cache_output=False):
         """Initialize the markdown converter.
 
         Args:
             base_url: Base URL of the Jira instance (e.g., 'https://company.atlassian.net')
             domain: Jira domain (e.g., 'company.atlassian.net')
+            cache_output: If True, compose_markdown reuses its previous result for
+                an issue whose key, ``updated`` timestamp, attachments and field
+                settings are unchanged. Off by default, since edits that don't
+                bump ``updated`` would be missed.
         """
         self.base_url = base_url
         self.domain = domain
+        # fingerprint -> composed markdown, oldest first; None when disabled
+        self._compose_cache = {} if cache_output else None
         self._downloaded_attachments = []
-        self._attachments_by_id = {}
-        self._attachments_by_name = {}
+        # ("id", id) / ("name", lowercased filename) -> downloaded attachment
+        self._attachment_index = {}
+        # id(ADF node) -> (node, rendering). Keeping the node alive stops its id
+        # from being reused; cleared per issue by _prepare_attachment_lookup
+        self._adf_markdown_cache = {}
+        self._adf_text_cache = {}
+
+        # Attachment URL patterns only depend on the domain, so build them once
+        self._attachment_link_pattern, self._generic_url_pattern = _build_attachment_patterns(
+            domain
+        )
 
     def _prepare_attachment_lookup(self, downloaded_attachments):
-        """Create lookup dictionaries for downloaded attachments."""
+        """Create the lookup index for downloaded attachments.
+
+        Keys are ``("id", attachment_id)`` with the id as a string, and
+        ``("name", filename)`` lowercased, for both the original and the
+        local filename.
+        """
         self._downloaded_attachments = downloaded_attachments or []
-        self._attachments_by_id = {}
-        self._attachments_by_name = {}
+        self._attachment_index = index = {}
+        # Rendered media depends on the lookups
+        self._adf_markdown_cache = {}
+        self._adf_text_cache = {}
 
         for attachment in self._downloaded_attachments:
             if not attachment:
@@ -34,29 +344,24 @@ class MarkdownConverter:
 
             attachment_id = attachment.get("attachment_id")
             if attachment_id is not None:
-                self._attachments_by_id[str(attachment_id)] = attachment
+                index["id", str(attachment_id)] = attachment
 
-            for name in filter(
-                None,
-                [
-                    attachment.get("original_filename"),
-                    attachment.get("filename"),
-                ],
-            ):
-                self._attachments_by_name[name.lower()] = attachment
+            for name in (attachment.get("original_filename"), attachment.get("filename")):
+                if name:
+                    index["name", name.lower()] = attachment
 
     def _get_attachment_for_media(self, attachment_id=None, filename_hint=None):
         """Find a downloaded attachment by id or filename hint."""
+        index = self._attachment_index
         if attachment_id is not None:
-            attachment = self._attachments_by_id.get(str(attachment_id))
+            if not isinstance(attachment_id, str):
+                attachment_id = str(attachment_id)
+            attachment = index.get(("id", attachment_id))
             if attachment:
                 return attachment
 
         if filename_hint:
-            normalized = filename_hint.strip().lower()
-            attachment = self._attachments_by_name.get(normalized)
-            if attachment:
-                return attachment
+            return index.get(("name", filename_hint.strip().lower()))
 
         return None
 
@@ -83,7 +388,7 @@ class MarkdownConverter:
 
         if attachment:
             local_name = attachment.get("filename")
-            encoded_filename = quote(local_name, safe="") if local_name else ""
+            encoded_filename = _quote_filename(local_name) if local_name else ""
             alt_text = (
                 filename_hint
                 or attachment.get("original_filename")
@@ -108,37 +413,85 @@ class MarkdownConverter:
         if not html_content:
             return ""
 
-        # Remove Atlassian-specific wrappers around images to keep plain Markdown embeds
-        html_content = re.sub(
-            r"<jira-attachment-thumbnail[^>]*>(.*?)</jira-attachment-thumbnail>",
-            r"\1",
-            html_content,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
-        html_content = re.sub(
-            r"<a\b[^>]*>\s*(<img\b[^>]*>)\s*</a>",
-            r"\1",
-            html_content,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
+        # Short fragments (signatures, boilerplate replies) recur across
+        # comments and issues; long ones are converted without caching
+        if len(html_content) <= _HTML_CACHE_MAX_LENGTH:
+            return _convert_html_cached(html_content)
+        return _convert_html(html_content)
 
-        # Convert HTML to Markdown using markdownify
-        markdown = md(html_content, heading_style="ATX", bullets="*-+")
+    def _prepare_attachments(self, downloaded_attachments):
+        """Build the link-rewriting callback for a list of attachments.
 
-        # Clean up any residual HTML tags that weren't converted
-        markdown = re.sub(r"<[^>]+>", "", markdown)
+        Secure URLs name the attachment by its original filename, either as is
+        or URL-encoded; REST URLs by its id. When several attachments share a
+        name or id, the first one wins.
 
-        # Clean up excessive whitespace
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        Args:
+            downloaded_attachments: List of downloaded attachment info
 
-        return markdown.strip()
+        Returns:
+            tuple: ``(pattern, replace)``, the attachment link regex and the
+                ``re.sub`` replacement function for its matches
+        """
+        # Attachment ids and original filenames (both spellings) ->
+        # URL-encoded local filenames
+        by_id = {}
+        by_filename = {}
+        for attachment in downloaded_attachments or []:
+            original_filename = attachment["original_filename"]
+            attachment_id = attachment.get("attachment_id")
+            if not original_filename and not attachment_id:
+                continue
 
-    def replace_attachment_links(self, markdown_content, downloaded_attachments):
+            # URL encode filename for markdown links
+            encoded_filename = _quote_filename(attachment["filename"])
+            if original_filename:
+                by_filename.setdefault(original_filename, encoded_filename)
+                by_filename.setdefault(_quote_filename(original_filename), encoded_filename)
+            if attachment_id:
+                by_id.setdefault(str(attachment_id), encoded_filename)
+
+        generic_url = self._generic_url_pattern
+        link_pattern = self._attachment_link_pattern
+        if not all(map(_RE_ATTACHMENT_FNAME.fullmatch, by_filename)):
+            # Names like "a)b.png" need the secure branch to list them literally
+            link_pattern = _build_attachment_patterns(
+                self.domain, tuple(sorted(by_filename))
+            )[0]
+
+        def rewrite_attachment_link(m):
+            pre, text = m.group("pre", "text")
+            if not text and pre == "[]":
+                # Empty-text links are left alone, whichever URL they point to
+                return m.group(0)
+            attachment_id = m.group("id")
+            if attachment_id is None:
+                encoded_filename = by_filename.get(m.group("fname"))
+                if encoded_filename is None:
+                    return m.group(0)
+            else:
+                encoded_filename = by_id.get(attachment_id)
+                if encoded_filename is None and not generic_url.fullmatch(m.group("url")):
+                    return m.group(0)
+            if encoded_filename is not None:
+                # Images ![alt](url) and links [text](url) -> same text, local filename
+                return f"{pre}({encoded_filename})"
+            if not text:
+                return m.group(0)
+            # Fallback for URLs that don't identify a downloaded attachment:
+            # keep the alt/link text and use it as the filename
+            return f"{pre}({_quote_filename(text)})"
+
+        return link_pattern, rewrite_attachment_link
+
+    def replace_attachment_links(self, markdown_content, downloaded_attachments, prepared=None):
         """Replace Jira attachment URLs with local file references.
 
         Args:
             markdown_content: Markdown content with Jira attachment URLs
             downloaded_attachments: List of downloaded attachment info
+            prepared: Result of ``_prepare_attachments(downloaded_attachments)``,
+                to reuse across calls for the same issue, or None.
 
         Returns:
             str: Markdown content with local file references
@@ -146,88 +499,16 @@ class MarkdownConverter:
         if not downloaded_attachments:
             return markdown_content
 
-        # Escape special regex characters in domain
-        escaped_domain = re.escape(self.domain)
-        optional_domain = f"(?:https?://{escaped_domain})?"
-        rest_prefix = f"{optional_domain}/(?:jira/)?rest/api/[0-9]+/attachment"
-        secure_prefix = f"{optional_domain}/secure/attachment"
-
-        # For secure attachment URLs with filename in path
-        for attachment in downloaded_attachments:
-            filename = attachment["filename"]
-            original_filename = attachment["original_filename"]
-
-            # URL encode filename for markdown links
-            encoded_filename = quote(filename, safe="")
-
-            if original_filename:
-                # Escape the original filename for regex
-                escaped_original = re.escape(original_filename)
-                # Also try URL-encoded version of the filename
-                encoded_original = re.escape(quote(original_filename, safe=""))
-                # Pattern for secure URLs with this specific filename (regular or URL-encoded)
-                patterns_to_try = [
-                    f"{secure_prefix}/[0-9]+/{escaped_original}",
-                    f"{secure_prefix}/[0-9]+/{encoded_original}",
-                ]
-
-                for pattern in patterns_to_try:
-                    # Replace in images: ![alt](url) -> ![alt](filename)
-                    markdown_content = re.sub(
-                        f"(!\\[[^\\]]*\\])\\({pattern}\\)",
-                        f"\\1({encoded_filename})",
-                        markdown_content,
-                    )
-                    # Replace in links: [text](url) -> [text](filename)
-                    markdown_content = re.sub(
-                        f"(\\[[^\\]]+\\])\\({pattern}\\)",
-                        f"\\1({encoded_filename})",
-                        markdown_content,
-                    )
-            attachment_id = attachment.get("attachment_id")
-            if attachment_id:
-                escaped_id = re.escape(str(attachment_id))
-                id_pattern = f"{rest_prefix}/(?:content|thumbnail)/{escaped_id}"
-                markdown_content = re.sub(
-                    f"(!\\[[^\\]]*\\])\\({id_pattern}\\)",
-                    f"\\1({encoded_filename})",
-                    markdown_content,
-                )
-                markdown_content = re.sub(
-                    f"(\\[[^\\]]+\\])\\({id_pattern}\\)",
-                    f"\\1({encoded_filename})",
-                    markdown_content,
-                )
-
-        # For generic attachment content URLs (without filename in path)
-        # Replace all remaining Jira attachment URLs with placeholder
-        # This is a fallback for URLs that don't have the filename in them
-        patterns = [
-            f"{optional_domain}/jira/rest/api/[0-9]+/attachment/content/[0-9]+",
-            f"{optional_domain}/rest/api/[0-9]+/attachment/content/[0-9]+",
-            f"{optional_domain}/jira/rest/api/[0-9]+/attachment/thumbnail/[0-9]+",
-        ]
-
-        for pattern in patterns:
-            # For any remaining attachment URLs, try to infer from context
-            # Look for patterns like ![filename](url) and use the filename from the alt text
-            markdown_content = re.sub(
-                f"!\\[([^\\]]*)\\]\\({pattern}\\)",
-                lambda m: f"![{m.group(1)}]({quote(m.group(1), safe='')})"
-                if m.group(1)
-                else m.group(0),
-                markdown_content,
-            )
-            # For links, keep the link text but replace URL
-            markdown_content = re.sub(
-                f"\\[([^\\]]+)\\]\\({pattern}\\)",
-                lambda m: f"[{m.group(1)}]({quote(m.group(1), safe='')})"
-                if m.group(1)
-                else m.group(0),
-                markdown_content,
-            )
+        # Every pattern below requires this literal, and most comment bodies
+        # don't contain it; a substring test is far cheaper than the regex.
+        # (The domain itself can't be used: relative URLs are matched too.)
+        if "/attachment/" not in markdown_content:
+            return markdown_content
 
-        return markdown_content
+        if prepared is None:
+            prepared = self._prepare_attachments(downloaded_attachments)
+        link_pattern, rewrite_attachment_link = prepared
+        return link_pattern.sub(rewrite_attachment_link, markdown_content)
 
     def _compose_linked_issues_section(self, issue_data):
         """Compose the linked issues section of the markdown.
@@ -316,252 +597,361 @@ class MarkdownConverter:
             # If it's just a string, return it as-is
             return adf_content
 
-        if not isinstance(adf_content, dict):
-            return ""
+        if isinstance(adf_content, dict):
+            cached = self._adf_markdown_cache.get(id(adf_content))
+            if cached is not None and cached[0] is adf_content:
+                return cached[1]
+
+            # Fast path: most comments are a single paragraph of plain text
+            text = self._adf_plain_text(adf_content)
+            if text is None:
+                out = []
+                self._parse_adf_into(adf_content, out)
+                text = "".join(out)
+            self._adf_markdown_cache[id(adf_content)] = (adf_content, text)
+            return text
 
-        doc_type = adf_content.get("type", "")
-
-        # Handle different node types
-        if doc_type == "doc":
-            # Document root - process all content nodes
-            content = adf_content.get("content", [])
-            return "\n\n".join(self._parse_adf_to_markdown(node) for node in content)
-
-        elif doc_type == "paragraph":
-            # Paragraph - process inline content
-            content = adf_content.get("content", [])
-            if not content:
-                return ""
-            return "".join(self._parse_adf_to_markdown(node) for node in content)
-
-        elif doc_type == "text":
-            # Text node - apply marks if any
-            text = adf_content.get("text", "")
-            marks = adf_content.get("marks", [])
-
-            for mark in marks:
-                mark_type = mark.get("type", "")
-                if mark_type == "strong":
-                    text = f"**{text}**"
-                elif mark_type == "em":
-                    text = f"*{text}*"
-                elif mark_type == "code":
-                    text = f"`{text}`"
-                elif mark_type == "link":
-                    href = mark.get("attrs", {}).get("href", "")
-                    text = f"[{text}]({href})"
+        out = []
+        self._parse_adf_into(adf_content, out)
+        return "".join(out)
 
-            return text
+    @staticmethod
+    def _adf_plain_text(adf_content):
+        """Return the text of a doc or paragraph wrapping one unmarked text node.
 
-        elif doc_type == "bulletList":
-            # Bullet list
-            content = adf_content.get("content", [])
-            items = []
-            for item in content:
-                item_text = self._parse_adf_to_markdown(item)
-                # Add bullet point prefix
-                for line in item_text.split("\n"):
-                    if line:
-                        items.append(f"- {line}")
-            return "\n".join(items)
-
-        elif doc_type == "orderedList":
-            # Ordered list
-            content = adf_content.get("content", [])
-            items = []
-            for i, item in enumerate(content, 1):
-                item_text = self._parse_adf_to_markdown(item)
-                # Add number prefix
-                for j, line in enumerate(item_text.split("\n")):
-                    if line:
-                        if j == 0:
-                            items.append(f"{i}. {line}")
-                        else:
-                            items.append(f"   {line}")
-            return "\n".join(items)
-
-        elif doc_type == "listItem":
-            # List item - process content
-            content = adf_content.get("content", [])
-            return "\n".join(self._parse_adf_to_markdown(node) for node in content)
-
-        elif doc_type == "heading":
-            # Heading
-            level = adf_content.get("attrs", {}).get("level", 1)
-            content = adf_content.get("content", [])
-            text = "".join(self._parse_adf_to_markdown(node) for node in content)
-            return f"{'#' * level} {text}"
-
-        elif doc_type == "codeBlock":
-            # Code block
-            content = adf_content.get("content", [])
-            code = "\n".join(self._parse_adf_to_markdown(node) for node in content)
-            language = adf_content.get("attrs", {}).get("language", "")
-            return f"```{language}\n{code}\n```"
-
-        elif doc_type == "blockquote":
-            # Blockquote
-            content = adf_content.get("content", [])
-            quote_text = "\n".join(
-                self._parse_adf_to_markdown(node) for node in content
-            )
-            # Add > prefix to each line
-            return "\n".join(f"> {line}" for line in quote_text.split("\n"))
-
-        elif doc_type == "mediaSingle":
-            # Media container - render contained media nodes
-            content = adf_content.get("content", [])
-            rendered = [self._parse_adf_to_markdown(node) for node in content if node]
-            combined = "\n".join(filter(None, rendered))
-            if combined:
-                return combined
-
-            # Fall back to attributes if there is no nested media node
-            attrs = adf_content.get("attrs", {})
-            return self._media_attrs_to_markdown(attrs)
-
-        elif doc_type == "media":
-            # Concrete media node
-            attrs = adf_content.get("attrs", {})
-            return self._media_attrs_to_markdown(attrs)
-
-        elif doc_type == "mention":
-            # User mention
-            attrs = adf_content.get("attrs", {})
-            text = attrs.get("text", "") or attrs.get("id", "@user")
-            return f"@{text}"
-
-        elif doc_type == "hardBreak":
-            return "\n"
-
-        elif doc_type == "table":
-            content = adf_content.get("content", [])
-            rows = []
-            for i, row_node in enumerate(content):
-                cells = row_node.get("content", [])
-                cell_texts = []
-                for cell in cells:
-                    cell_content = cell.get("content", [])
-                    text = " ".join(
-                        self._parse_adf_to_markdown(node) for node in cell_content
-                    ).replace("\n", " ").strip()
-                    cell_texts.append(text)
-                rows.append("| " + " | ".join(cell_texts) + " |")
-                if i == 0:
-                    rows.append("| " + " | ".join("---" for _ in cell_texts) + " |")
-            return "\n".join(rows)
-
-        elif doc_type in ("tableRow", "tableHeader"):
-            # Handled inline by table parser
-            content = adf_content.get("content", [])
-            return " | ".join(
-                " ".join(
-                    self._parse_adf_to_markdown(n) for n in cell.get("content", [])
-                ).replace("\n", " ").strip()
-                for cell in content
-            )
+        Args:
+            adf_content: ADF node dict
 
-        elif doc_type == "tableCell":
-            content = adf_content.get("content", [])
-            return " ".join(
-                self._parse_adf_to_markdown(node) for node in content
-            ).replace("\n", " ").strip()
-
-        elif doc_type == "panel":
-            attrs = adf_content.get("attrs", {})
-            panel_type = attrs.get("panelType", "info").capitalize()
-            content = adf_content.get("content", [])
-            body = "\n".join(self._parse_adf_to_markdown(node) for node in content)
-            lines = []
-            lines.append(f"> **{panel_type}:**")
-            for line in body.split("\n"):
-                lines.append(f"> {line}" if line else ">")
-            return "\n".join(lines)
-
-        elif doc_type == "expand":
-            attrs = adf_content.get("attrs", {})
-            title = attrs.get("title", "Details")
-            content = adf_content.get("content", [])
-            body = "\n".join(self._parse_adf_to_markdown(node) for node in content)
-            lines = [f"**{title}**", ""]
-            for line in body.split("\n"):
-                lines.append(f"  {line}" if line else "")
-            return "\n".join(lines)
-
-        elif doc_type == "rule":
-            return "---"
-
-        elif doc_type == "emoji":
-            attrs = adf_content.get("attrs", {})
-            short_name = attrs.get("shortName", "")
-            return short_name if short_name else attrs.get("text", "")
-
-        elif doc_type == "status":
-            attrs = adf_content.get("attrs", {})
-            text = attrs.get("text", "")
-            return f"**{text}**"
-
-        elif doc_type == "date":
-            attrs = adf_content.get("attrs", {})
-            timestamp = attrs.get("timestamp", "")
-            if timestamp:
-                from datetime import datetime, timezone
-
-                try:
-                    dt = datetime.fromtimestamp(
-                        int(timestamp) / 1000, tz=timezone.utc
-                    )
-                    return dt.strftime("%Y-%m-%d")
-                except (ValueError, TypeError, OSError):
-                    return str(timestamp)
-            return ""
+        Returns:
+            str or None: The text, or None if the node has any other shape
+        """
+        node = adf_content
+        for container_type in ("doc", "paragraph"):
+            if node.get("type") == container_type:
+                content = node.get("content")
+                if not content or len(content) != 1 or not isinstance(content[0], dict):
+                    return None
+                node = content[0]
+
+        if node is adf_content or node.get("type") != "text" or node.get("marks"):
+            return None
+        return node.get("text", "")
+
+    def _parse_adf_into(self, adf_content, out):
+        """Append the Markdown fragments for an ADF node to ``out``.
+
+        Containers that only join their children (``_ADF_CONTAINER_SEPARATORS``,
+        plus unknown node types) are expanded on an explicit stack, so deeply
+        nested documents don't recurse through them. Other node types are
+        dispatched through ``_ADF_HANDLERS``, which receive the node's child
+        list alongside the node.
 
-        elif doc_type == "inlineCard":
-            attrs = adf_content.get("attrs", {})
-            url = attrs.get("url", "")
-            if url:
-                return f"[{url}]({url})"
-            return ""
+        Args:
+            adf_content: ADF structure (dict) or string content
+            out: List that rendered string fragments are appended to
+        """
+        handlers = self._ADF_HANDLERS
+        separators = self._ADF_CONTAINER_SEPARATORS
+        # Pending nodes, last one first; separators between children are
+        # pushed as plain strings, which are emitted as they are
+        stack = [adf_content]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                out.append(node)
+                continue
 
-        elif doc_type == "taskList":
-            content = adf_content.get("content", [])
-            items = []
-            for item in content:
-                items.append(self._parse_adf_to_markdown(item))
-            return "\n".join(items)
-
-        elif doc_type == "taskItem":
-            attrs = adf_content.get("attrs", {})
-            state = attrs.get("state", "TODO")
-            checkbox = "[x]" if state == "DONE" else "[ ]"
-            content = adf_content.get("content", [])
-            text = "".join(self._parse_adf_to_markdown(node) for node in content)
-            return f"- {checkbox} {text}"
-
-        elif doc_type == "decisionList":
-            content = adf_content.get("content", [])
-            items = []
-            for item in content:
-                items.append(self._parse_adf_to_markdown(item))
-            return "\n".join(items)
-
-        elif doc_type == "decisionItem":
-            attrs = adf_content.get("attrs", {})
-            content = adf_content.get("content", [])
-            text = "".join(self._parse_adf_to_markdown(node) for node in content)
-            return f"> **Decision:** {text}"
-
-        elif doc_type == "mediaGroup":
-            content = adf_content.get("content", [])
-            rendered = [self._parse_adf_to_markdown(node) for node in content if node]
-            return "\n".join(filter(None, rendered))
+            if not isinstance(node, dict):
+                continue
 
-        else:
-            # Unknown type - try to process content if it exists
-            content = adf_content.get("content", [])
-            if content:
-                return "\n".join(self._parse_adf_to_markdown(node) for node in content)
-            return ""
+            get = node.get
+            node_type = get("type")
+            content = get("content") or ()
+            separator = separators.get(node_type)
+            if separator is None:
+                handler = handlers.get(node_type)
+                if handler is not None:
+                    handler(self, node, content, out)
+                    continue
+                # Unknown type - try to process content if it exists
+                separator = "\n"
+
+            first = True
+            for child in reversed(content):
+                if not first and separator:
+                    stack.append(separator)
+                first = False
+                stack.append(child)
+
+    def _adf_emit_children(self, content, out, separator):
+        """Append each child node to ``out``, separated by ``separator``.
+
+        Args:
+            content: Child nodes of an ADF node
+            out: List that rendered string fragments are appended to
+            separator: String placed between consecutive children
+        """
+        first = True
+        for node in content:
+            if not first:
+                out.append(separator)
+            first = False
+            self._parse_adf_into(node, out)
+
+    def _adf_render_children(self, content, separator):
+        """Render child nodes to a single string.
+
+        Used by containers that post-process their body line by line.
+
+        Args:
+            content: Child nodes of an ADF node
+            separator: String placed between consecutive children
+
+        Returns:
+            str: Rendered markdown of the children
+        """
+        buf = []
+        self._adf_emit_children(content, buf, separator)
+        return "".join(buf)
+
+    def _adf_render_nonempty(self, content):
+        """Render each truthy child and keep only non-empty results.
+
+        Args:
+            content: Child nodes of an ADF node
+
+        Returns:
+            list: Non-empty rendered markdown strings, one per child
+        """
+        rendered = []
+        for node in content:
+            if node:
+                text = self._parse_adf_to_markdown(node)
+                if text:
+                    rendered.append(text)
+        return rendered
+
+    def _adf_text(self, adf_content, content, out):
+        """Text node - apply marks if any."""
+        text = adf_content.get("text", "")
+        marks = adf_content.get("marks")
+        if not marks:
+            out.append(text)
+            return
+
+        # The first mark wraps innermost, so prefixes are emitted in reverse
+        prefixes = []
+        suffixes = []
+        for mark in marks:
+            mark_type = mark.get("type")
+            if mark_type == "strong":
+                prefixes.append("**")
+                suffixes.append("**")
+            elif mark_type == "em":
+                prefixes.append("*")
+                suffixes.append("*")
+            elif mark_type == "code":
+                prefixes.append("`")
+                suffixes.append("`")
+            elif mark_type == "link":
+                href = (mark.get("attrs") or _EMPTY_ATTRS).get("href", "")
+                prefixes.append("[")
+                suffixes.append(f"]({href})")
+
+        out.extend(reversed(prefixes))
+        out.append(text)
+        out.extend(suffixes)
+
+    def _adf_bullet_list(self, adf_content, content, out):
+        """Bullet list - prefix every non-empty line of each item."""
+        items = []
+        for item in content:
+            for line in self._parse_adf_to_markdown(item).split("\n"):
+                if line:
+                    items.append(f"- {line}")
+        out.append("\n".join(items))
+
+    def _adf_ordered_list(self, adf_content, content, out):
+        """Ordered list - number the first line of each item, indent the rest."""
+        items = []
+        for i, item in enumerate(content, 1):
+            for j, line in enumerate(self._parse_adf_to_markdown(item).split("\n")):
+                if line:
+                    if j == 0:
+                        items.append(f"{i}. {line}")
+                    else:
+                        items.append(f"   {line}")
+        out.append("\n".join(items))
+
+    def _adf_heading(self, adf_content, content, out):
+        """Heading."""
+        level = (adf_content.get("attrs") or _EMPTY_ATTRS).get("level", 1)
+        out.append(f"{'#' * level} ")
+        self._adf_emit_children(content, out, "")
+
+    def _adf_code_block(self, adf_content, content, out):
+        """Code block."""
+        language = (adf_content.get("attrs") or _EMPTY_ATTRS).get("language", "")
+        out.append(f"```{language}\n")
+        self._adf_emit_children(content, out, "\n")
+        out.append("\n```")
+
+    def _adf_blockquote(self, adf_content, content, out):
+        """Blockquote - add > prefix to each line."""
+        quote_text = self._adf_render_children(content, "\n")
+        out.append("> " + quote_text.replace("\n", "\n> "))
+
+    def _adf_media_single(self, adf_content, content, out):
+        """Media container - render contained media nodes."""
+        rendered = self._adf_render_nonempty(content)
+        if rendered:
+            out.append("\n".join(rendered))
+            return
+
+        # Fall back to attributes if there is no nested media node
+        out.append(self._media_attrs_to_markdown(adf_content.get("attrs") or _EMPTY_ATTRS))
+
+    def _adf_media(self, adf_content, content, out):
+        """Concrete media node."""
+        out.append(self._media_attrs_to_markdown(adf_content.get("attrs") or _EMPTY_ATTRS))
+
+    def _adf_mention(self, adf_content, content, out):
+        """User mention."""
+        attrs = adf_content.get("attrs") or _EMPTY_ATTRS
+        text = attrs.get("text", "") or attrs.get("id", "@user")
+        out.append(f"@{text}")
+
+    def _adf_hard_break(self, adf_content, content, out):
+        """Hard line break."""
+        out.append("\n")
+
+    def _adf_cell_text(self, cell):
+        """Render a table cell's content as a single line."""
+        content = cell.get("content") or ()
+        return self._adf_render_children(content, " ").replace("\n", " ").strip()
+
+    def _adf_table(self, adf_content, content, out):
+        """Table - first row becomes the header row."""
+        rows = []
+        for i, row_node in enumerate(content):
+            cell_texts = [self._adf_cell_text(cell) for cell in row_node.get("content") or ()]
+            rows.append("| " + " | ".join(cell_texts) + " |")
+            if i == 0:
+                rows.append("| " + " | ".join(["---"] * len(cell_texts)) + " |")
+        out.append("\n".join(rows))
+
+    def _adf_table_row(self, adf_content, content, out):
+        """Table row or header outside a table - cells joined with pipes."""
+        out.append(" | ".join([self._adf_cell_text(cell) for cell in content]))
+
+    def _adf_table_cell(self, adf_content, content, out):
+        """Table cell outside a table."""
+        out.append(self._adf_render_children(content, " ").replace("\n", " ").strip())
+
+    def _adf_panel(self, adf_content, content, out):
+        """Panel - rendered as a labelled blockquote."""
+        attrs = adf_content.get("attrs") or _EMPTY_ATTRS
+        panel_type = attrs.get("panelType", "info").capitalize()
+        body = self._adf_render_children(content, "\n")
+        lines = []
+        lines.append(f"> **{panel_type}:**")
+        for line in body.split("\n"):
+            lines.append(f"> {line}" if line else ">")
+        out.append("\n".join(lines))
+
+    def _adf_expand(self, adf_content, content, out):
+        """Expand - bold title followed by the indented body."""
+        attrs = adf_content.get("attrs") or _EMPTY_ATTRS
+        title = attrs.get("title", "Details")
+        body = self._adf_render_children(content, "\n")
+        lines = [f"**{title}**", ""]
+        for line in body.split("\n"):
+            lines.append(f"  {line}" if line else "")
+        out.append("\n".join(lines))
+
+    def _adf_rule(self, adf_content, content, out):
+        """Horizontal rule."""
+        out.append("---")
+
+    def _adf_emoji(self, adf_content, content, out):
+        """Emoji - short name, or its text when there is none."""
+        attrs = adf_content.get("attrs") or _EMPTY_ATTRS
+        short_name = attrs.get("shortName", "")
+        out.append(short_name if short_name else attrs.get("text", ""))
+
+    def _adf_status(self, adf_content, content, out):
+        """Status lozenge."""
+        text = (adf_content.get("attrs") or _EMPTY_ATTRS).get("text", "")
+        out.append(f"**{text}**")
+
+    def _adf_date(self, adf_content, content, out):
+        """Date - millisecond timestamp rendered as YYYY-MM-DD (UTC)."""
+        timestamp = (adf_content.get("attrs") or _EMPTY_ATTRS).get("timestamp", "")
+        if timestamp:
+            try:
+                dt = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+                out.append(dt.strftime("%Y-%m-%d"))
+            except (ValueError, TypeError, OSError):
+                out.append(str(timestamp))
+
+    def _adf_inline_card(self, adf_content, content, out):
+        """Inline card - link to its URL."""
+        url = (adf_content.get("attrs") or _EMPTY_ATTRS).get("url", "")
+        if url:
+            out.append(f"[{url}]({url})")
+
+    def _adf_task_item(self, adf_content, content, out):
+        """Task item - checkbox list entry."""
+        state = (adf_content.get("attrs") or _EMPTY_ATTRS).get("state", "TODO")
+        checkbox = "[x]" if state == "DONE" else "[ ]"
+        out.append(f"- {checkbox} ")
+        self._adf_emit_children(content, out, "")
+
+    def _adf_decision_item(self, adf_content, content, out):
+        """Decision item."""
+        out.append("> **Decision:** ")
+        self._adf_emit_children(content, out, "")
+
+    def _adf_media_group(self, adf_content, content, out):
+        """Media group - render each media node on its own line."""
+        out.append("\n".join(self._adf_render_nonempty(content)))
+
+    # Container node type -> separator placed between its rendered children
+    _ADF_CONTAINER_SEPARATORS = {
+        "doc": "\n\n",
+        "paragraph": "",
+        "listItem": "\n",
+        "taskList": "\n",
+        "decisionList": "\n",
+    }
+
+    # Other ADF node types -> renderer, used by _parse_adf_into
+    _ADF_HANDLERS = {
+        "text": _adf_text,
+        "bulletList": _adf_bullet_list,
+        "orderedList": _adf_ordered_list,
+        "heading": _adf_heading,
+        "codeBlock": _adf_code_block,
+        "blockquote": _adf_blockquote,
+        "mediaSingle": _adf_media_single,
+        "media": _adf_media,
+        "mention": _adf_mention,
+        "hardBreak": _adf_hard_break,
+        "table": _adf_table,
+        "tableRow": _adf_table_row,
+        "tableHeader": _adf_table_row,
+        "tableCell": _adf_table_cell,
+        "panel": _adf_panel,
+        "expand": _adf_expand,
+        "rule": _adf_rule,
+        "emoji": _adf_emoji,
+        "status": _adf_status,
+        "date": _adf_date,
+        "inlineCard": _adf_inline_card,
+        "taskItem": _adf_task_item,
+        "decisionItem": _adf_decision_item,
+        "mediaGroup": _adf_media_group,
+    }
 
     def _compose_environment_section(self, issue_data):
         """Compose the environment section of the markdown.
@@ -610,9 +1000,35 @@ class MarkdownConverter:
         if adf_content.get("type") == "text":
             return adf_content.get("text", "")
 
-        children = adf_content.get("content", [])
-        parts = [self._adf_to_plain_text(child) for child in children]
-        return " ".join(part for part in parts if part)
+        cached = self._adf_text_cache.get(id(adf_content))
+        if cached is not None and cached[0] is adf_content:
+            return cached[1]
+
+        parts = []
+        self._collect_adf_text(adf_content.get("content", ()), parts)
+        text = " ".join(parts)
+        self._adf_text_cache[id(adf_content)] = (adf_content, text)
+        return text
+
+    @classmethod
+    def _collect_adf_text(cls, children, parts):
+        """Append the non-empty text found under ADF child nodes to ``parts``.
+
+        Args:
+            children: Iterable of ADF nodes (dicts or strings)
+            parts: List collecting the text fragments, in document order
+        """
+        for child in children:
+            if isinstance(child, str):
+                if child:
+                    parts.append(child)
+            elif isinstance(child, dict):
+                if child.get("type") == "text":
+                    text = child.get("text", "")
+                    if text:
+                        parts.append(text)
+                else:
+                    cls._collect_adf_text(child.get("content", ()), parts)
 
     def _compose_worklogs_section(self, issue_data):
         """Compose the worklogs section of the markdown.
@@ -659,8 +1075,8 @@ class MarkdownConverter:
             started = entry.get("started", "")
             date = started[:10] if started else ""
             comment = self._adf_to_plain_text(entry.get("comment"))
-            # Escape pipes for table safety
-            comment = comment.replace("|", "\\|")
+            # Escape pipes and fold newlines, either of which would break the row
+            comment = comment.replace("|", "\\|").replace("\n", " ")
             lines.append(f"| {author} | {time_spent} | {date} | {comment} |")
 
         lines.append("")
@@ -702,8 +1118,6 @@ class MarkdownConverter:
         Returns:
             list: Lines of markdown content for custom fields section, or empty list.
         """
-        from .custom_field_renderer import CustomFieldRenderer
-
         fields = issue_data.get("fields", {})
 
         # Collect custom fields with non-null values
@@ -758,12 +1172,13 @@ class MarkdownConverter:
         lines.append("")
         return lines
 
-    def _compose_comments_section(self, issue_data, downloaded_attachments):
+    def _compose_comments_section(self, issue_data, downloaded_attachments, prepared_attachments=None):
         """Compose the comments section of the markdown.
 
         Args:
             issue_data: Raw issue data from Jira API
             downloaded_attachments: List of downloaded attachment info
+            prepared_attachments: Precomputed ``_prepare_attachments`` result, or None.
 
         Returns:
             list: Lines of markdown content for the comments section, or empty list if no comments
@@ -791,24 +1206,7 @@ class MarkdownConverter:
             created = comment.get("created", "")
 
             # Format the date (ISO 8601 to readable format)
-            if created:
-                # Parse and format: '2025-08-16T10:30:00.000+0000' -> '2025-08-16 10:30 AM'
-                from datetime import datetime
-
-                try:
-                    # Handle various ISO formats
-                    if created.endswith("Z"):
-                        created = created[:-1] + "+00:00"
-                    elif "+" in created and not created.endswith("+00:00"):
-                        # Replace +0000 with +00:00
-                        created = created.replace("+0000", "+00:00")
-
-                    dt = datetime.fromisoformat(created)
-                    formatted_date = dt.strftime("%Y-%m-%d %I:%M %p")
-                except Exception:
-                    formatted_date = created
-            else:
-                formatted_date = "Unknown date"
+            formatted_date = _format_iso_date(created) if created else "Unknown date"
 
             # Format the comment header
             lines.append(f"**{author}** - _{formatted_date}_")
@@ -837,21 +1235,20 @@ class MarkdownConverter:
                 else:
                     body_md = "*No comment body*"
 
-            # Replace attachment links in the comment
-            body_md = self.replace_attachment_links(body_md, downloaded_attachments)
-
             # Add the comment body
             lines.append(body_md)
 
             # Add separator between comments (except after the last one)
             if i < len(comments) - 1:
-                lines.append("")
-                lines.append("---")
-                lines.append("")
+                lines.extend(_COMMENT_SEP)
 
         lines.append("")  # Add final spacing
 
-        return lines
+        # Replace attachment links in all comments with one pass per pattern
+        section = self.replace_attachment_links(
+            "\n".join(lines), downloaded_attachments, prepared_attachments
+        )
+        return [section]
 
     def _generate_metadata_dict(self, issue_data):
         """Generate metadata dictionary from Jira issue data.
@@ -945,57 +1342,28 @@ class MarkdownConverter:
 
         return metadata
 
-    def compose_markdown(self, issue_data, downloaded_attachments, field_cache=None, field_filter=None):
-        """Compose the final markdown file content.
+    def _compose_description_section(self, issue_data, downloaded_attachments, prepared_attachments=None):
+        """Compose the description section of the markdown.
 
         Args:
             issue_data: Raw issue data from Jira API
             downloaded_attachments: List of downloaded attachment info
-            field_cache: FieldMetadataCache instance for custom field name resolution, or None.
-            field_filter: Dict with 'include'/'exclude' keys from ConfigManager, or None.
+            prepared_attachments: Precomputed ``_prepare_attachments`` result, or None.
 
         Returns:
-            str: Complete markdown content for the issue
+            list: Lines of markdown content for the description section
         """
         fields = issue_data.get("fields", {})
         rendered_fields = issue_data.get("renderedFields", {})
 
-        # Allow ADF parsing to resolve downloaded attachments
-        self._prepare_attachment_lookup(downloaded_attachments)
-
-        # Generate metadata dictionary
-        metadata = self._generate_metadata_dict(issue_data)
-
-        # Extract key and summary for the title
-        key = metadata.get("key", "UNKNOWN")
-        summary = metadata.get("summary", "No Summary")
-
-        # Start composing markdown
-        lines = []
-
-        # YAML frontmatter
-        yaml_content = yaml.dump(
-            metadata, default_flow_style=False, allow_unicode=True, sort_keys=False
-        )
-        lines.append("---")
-        lines.append(yaml_content.rstrip())
-        lines.append("---")
-        lines.append("")
-
-        # Title with link to Jira issue
-        lines.append(f"# [{key}]({self.base_url}/browse/{key}): {summary}")
-        lines.append("")
-
-        # Description section
-        lines.append("## Description")
-        lines.append("")
+        lines = ["## Description", ""]
 
         # Convert description from HTML to Markdown
         description_html = rendered_fields.get("description", "")
         if description_html:
             description_md = self.convert_html_to_markdown(description_html)
             description_md = self.replace_attachment_links(
-                description_md, downloaded_attachments
+                description_md, downloaded_attachments, prepared_attachments
             )
             lines.append(description_md)
         elif fields.get("description"):
@@ -1005,56 +1373,196 @@ class MarkdownConverter:
             else:
                 description_md = str(raw_desc)
             description_md = self.replace_attachment_links(
-                description_md, downloaded_attachments
+                description_md, downloaded_attachments, prepared_attachments
             )
             lines.append(description_md)
         else:
             lines.append("*No description provided*")
 
         lines.append("")
+        return lines
+
+    def _compose_attachments_section(self, downloaded_attachments):
+        """Compose the attachments section of the markdown.
+
+        Args:
+            downloaded_attachments: List of downloaded attachment info
+
+        Returns:
+            list: Lines of markdown content for the attachments section, or empty list
+        """
+        if not downloaded_attachments:
+            return []
+
+        lines = ["## Attachments", ""]
+        for attachment in downloaded_attachments:
+            filename = attachment["filename"]
+            mime_type = attachment["mime_type"]
+            encoded_filename = _quote_filename(filename)
+
+            # Check if it's an image
+            if mime_type and mime_type.startswith("image/"):
+                # Embed images
+                lines.append(f"- ![{filename}]({encoded_filename})")
+            else:
+                # Link other files
+                lines.append(f"- [{filename}]({encoded_filename})")
+        lines.append("")
+        return lines
+
+    def compose_markdown(self, issue_data, downloaded_attachments, field_cache=None, field_filter=None):
+        """Compose the final markdown file content.
+
+        Args:
+            issue_data: Raw issue data from Jira API
+            downloaded_attachments: List of downloaded attachment info
+            field_cache: FieldMetadataCache instance for custom field name resolution, or None.
+            field_filter: Dict with 'include'/'exclude' keys from ConfigManager, or None.
+
+        Returns:
+            str: Complete markdown content for the issue
+        """
+        cache_key = None
+        if self._compose_cache is not None:
+            cache_key = self._compose_cache_key(
+                issue_data, downloaded_attachments, field_cache, field_filter
+            )
+            cached = self._compose_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        buffer = io.StringIO()
+        self.compose_markdown_into(
+            buffer,
+            issue_data,
+            downloaded_attachments,
+            field_cache=field_cache,
+            field_filter=field_filter,
+        )
+        markdown = buffer.getvalue()
+
+        if cache_key is not None:
+            if len(self._compose_cache) >= _COMPOSE_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._compose_cache[next(iter(self._compose_cache))]
+            self._compose_cache[cache_key] = markdown
+        return markdown
+
+    @staticmethod
+    def _compose_cache_key(issue_data, downloaded_attachments, field_cache, field_filter):
+        """Fingerprint the inputs of compose_markdown for the output cache.
+
+        Args:
+            issue_data: Raw issue data from Jira API
+            downloaded_attachments: List of downloaded attachment info
+            field_cache: FieldMetadataCache instance, or None (compared by identity)
+            field_filter: Field filter dict, or None
+
+        Returns:
+            tuple: Hashable cache key
+        """
+        attachments = tuple(
+            (
+                attachment.get("filename"),
+                attachment.get("original_filename"),
+                attachment.get("attachment_id"),
+                attachment.get("mime_type"),
+            )
+            for attachment in downloaded_attachments or []
+        )
+        return (
+            issue_data.get("key"),
+            issue_data.get("fields", {}).get("updated"),
+            attachments,
+            field_cache,
+            repr(field_filter),
+        )
+
+    def compose_markdown_into(
+        self, stream, issue_data, downloaded_attachments, field_cache=None, field_filter=None
+    ):
+        """Write the markdown file content to a text stream section by section.
+
+        Produces exactly the same text as :meth:`compose_markdown` without
+        holding the whole document in memory at once.
+
+        Args:
+            stream: Writable text stream (e.g. an open file or ``io.StringIO``)
+            issue_data: Raw issue data from Jira API
+            downloaded_attachments: List of downloaded attachment info
+            field_cache: FieldMetadataCache instance for custom field name resolution, or None.
+            field_filter: Dict with 'include'/'exclude' keys from ConfigManager, or None.
+        """
+        started = False
+
+        def emit(section_lines):
+            nonlocal started
+            if not section_lines:
+                return
+            if started:
+                stream.write("\n")
+            stream.write("\n".join(section_lines))
+            started = True
+
+        # Allow ADF parsing to resolve downloaded attachments
+        self._prepare_attachment_lookup(downloaded_attachments)
+        # Link rewrites are shared by the description and every comment
+        prepared_attachments = self._prepare_attachments(downloaded_attachments)
+
+        # Generate metadata dictionary
+        metadata = self._generate_metadata_dict(issue_data)
+
+        # Extract key and summary for the title
+        key = metadata.get("key", "UNKNOWN")
+        summary = metadata.get("summary", "No Summary")
+
+        # YAML frontmatter
+        yaml_content = _dump_simple_yaml(metadata)
+
+        # Title with link to Jira issue
+        emit(
+            [
+                "---",
+                yaml_content.rstrip(),
+                "---",
+                "",
+                f"# [{key}]({self.base_url}/browse/{key}): {summary}",
+                "",
+            ]
+        )
+
+        # Description section
+        emit(
+            self._compose_description_section(
+                issue_data, downloaded_attachments, prepared_attachments
+            )
+        )
 
         # Environment section (always present)
-        lines.extend(self._compose_environment_section(issue_data))
+        emit(self._compose_environment_section(issue_data))
 
         # Linked Issues section (always present)
-        lines.extend(self._compose_linked_issues_section(issue_data))
+        emit(self._compose_linked_issues_section(issue_data))
 
         # Subtasks section (always present)
-        lines.extend(self._compose_subtasks_section(issue_data))
+        emit(self._compose_subtasks_section(issue_data))
 
         # Worklogs section (always present)
-        lines.extend(self._compose_worklogs_section(issue_data))
+        emit(self._compose_worklogs_section(issue_data))
 
         # Custom Fields section (only if custom fields present)
-        custom_field_lines = self._compose_custom_fields_section(
-            issue_data, field_cache=field_cache, field_filter=field_filter
+        emit(
+            self._compose_custom_fields_section(
+                issue_data, field_cache=field_cache, field_filter=field_filter
+            )
         )
-        if custom_field_lines:
-            lines.extend(custom_field_lines)
 
         # Comments section (after description, before attachments)
-        comment_lines = self._compose_comments_section(
-            issue_data, downloaded_attachments
+        emit(
+            self._compose_comments_section(
+                issue_data, downloaded_attachments, prepared_attachments
+            )
         )
-        if comment_lines:
-            lines.extend(comment_lines)
 
         # Attachments section
-        if downloaded_attachments:
-            lines.append("## Attachments")
-            lines.append("")
-            for attachment in downloaded_attachments:
-                filename = attachment["filename"]
-                mime_type = attachment["mime_type"]
-                encoded_filename = quote(filename, safe="")
-
-                # Check if it's an image
-                if mime_type and mime_type.startswith("image/"):
-                    # Embed images
-                    lines.append(f"- ![{filename}]({encoded_filename})")
-                else:
-                    # Link other files
-                    lines.append(f"- [{filename}]({encoded_filename})")
-            lines.append("")
-
-        return "\n".join(lines)
+        emit(self._compose_attachments_section(downloaded_attachments))
@@ -0,0 +1,93 @@
+"""On-disk cache for Jira API responses with XDG-compliant storage."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+
+
+class ResponseCache:
+    """Stores JSON responses from idempotent Jira GETs for a fixed TTL."""
+
+    def __init__(self, domain, email, ttl_seconds):
+        """Initialize the response cache.
+
+        Args:
+            domain: Jira domain for cache isolation (e.g., 'company.atlassian.net')
+            email: Account the responses were fetched as. Each account gets
+                its own directory, since Jira permissions differ per user.
+            ttl_seconds: How long a stored response may be reused, in seconds
+        """
+        self.domain = domain
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(__name__)
+        # Hashed so the account name doesn't appear in the path
+        user = hashlib.sha256(email.lower().encode("utf-8")).hexdigest()[:16]
+        self._cache_dir = Path(user_cache_dir("jarkdown")) / "responses" / domain / user
+
+    @staticmethod
+    def key(method, url, params=None):
+        """Build the cache key for a request.
+
+        Args:
+            method: HTTP method (e.g., 'GET')
+            url: Request URL without query string
+            params: Query parameters dict, or None
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        request = json.dumps([method, url, sorted((params or {}).items())])
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return self._cache_dir / f"{key}.json"
+
+    def get(self, key):
+        """Load a stored response if it is younger than the TTL.
+
+        Args:
+            key: Cache key from ``key()``
+
+        Returns:
+            The decoded JSON response, or None if missing, expired or unreadable.
+        """
+        try:
+            data = json.loads(self._path(key).read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+        if (time.time() - data.get("cached_at", 0)) > self.ttl_seconds:
+            return None
+        return data.get("response")
+
+    def set(self, key, response):
+        """Store a response with the current timestamp.
+
+        The entry is written to a temporary file and renamed into place, so
+        readers never see a partial entry. Write failures are logged and
+        otherwise ignored, since the cache only saves requests.
+
+        Args:
+            key: Cache key from ``key()``
+            response: JSON-serializable response body
+        """
+        cache_data = {"cached_at": time.time(), "response": response}
+        tmp_name = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(json.dumps(cache_data))
+            os.replace(tmp_name, self._path(key))
+        except OSError as e:
+            # Don't leave a partial entry behind in the cache directory
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            self.logger.warning("Failed to write response cache: %s", e)
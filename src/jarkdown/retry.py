@@ -3,37 +3,166 @@
 import asyncio
 import random
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass, field
 from email.utils import parsedate_to_datetime
-from typing import Tuple
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
+
+import aiohttp
 
 logger = logging.getLogger(__name__)
 
+_random = random.random
+
+# Bounds on a server-requested Retry-After wait, in seconds
+_MIN_WAIT = 0.0
+_MAX_WAIT = 300.0
+
 
-@dataclass
+@dataclass(frozen=True)
 class RetryConfig:
     """Configuration for retry behavior with exponential backoff.
 
+    Frozen, since the backoff schedule is computed once at construction and
+    DEFAULT_RETRY is shared by every API call.
+
     Attributes:
         max_retries: Maximum number of retry attempts before raising.
         base_delay: Initial delay in seconds (doubles each attempt).
         max_delay: Cap on delay regardless of backoff calculation.
         jitter: If True, add random jitter to prevent thundering herd.
         retryable_status_codes: HTTP status codes that should trigger retry.
+            Any iterable is accepted and stored as a frozenset.
+        full_jitter: If True (and jitter is enabled), wait a random time
+            between 0 and the backoff delay ("full jitter") instead of adding
+            up to 10% to it. Spreads out clients retrying in lockstep.
+        max_retry_after: Longest Retry-After wait honored, in seconds; longer
+            server requests are cut to this.
     """
 
     max_retries: int = 3
     base_delay: float = 1.0
     max_delay: float = 60.0
     jitter: bool = True
-    retryable_status_codes: Tuple[int, ...] = (429, 503, 504)
+    retryable_status_codes: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    full_jitter: bool = False
+    max_retry_after: float = _MAX_WAIT
+    # Capped backoff delay before each retry, indexed by attempt
+    _delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "retryable_status_codes", frozenset(self.retryable_status_codes)
+        )
+        object.__setattr__(
+            self,
+            "_delays",
+            tuple(
+                min(self.base_delay * (1 << attempt), self.max_delay)
+                for attempt in range(self.max_retries + 1)
+            ),
+        )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return the delay before retrying after the given failed attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed.
+
+        Returns:
+            Exponential backoff delay in seconds, capped at max_delay, with
+            jitter applied if enabled.
+        """
+        delay = self._delays[attempt]
+        if self.jitter:
+            if self.full_jitter:
+                return delay * _random()
+            delay += delay * 0.1 * _random()
+        return delay
 
 
 DEFAULT_RETRY = RetryConfig()
 
 
-def parse_retry_after(header_value: str) -> float:
+class HostTokenBucket:
+    """Token bucket pacing the retries sent to one host.
+
+    Tasks throttled at the same moment back off for the same time and would
+    all retry together. Retries that wait on a shared bucket are let through
+    at most ``capacity`` at once and then one every ``1 / rate`` seconds.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated_at")
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second; must be positive.
+            capacity: Maximum number of tokens (retries let through at once).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    @classmethod
+    def from_config(cls, config: RetryConfig) -> "HostTokenBucket":
+        """Create a bucket allowing one retry per ``config.base_delay`` seconds.
+
+        Args:
+            config: RetryConfig whose base delay sets the rate.
+
+        Returns:
+            A new HostTokenBucket.
+        """
+        return cls(rate=1.0 / max(config.base_delay, 0.001))
+
+    async def acquire(self, min_wait: float = 0.0):
+        """Wait at least ``min_wait`` seconds, then until a token is free.
+
+        Args:
+            min_wait: Backoff delay the caller must wait regardless.
+        """
+        if min_wait > 0:
+            await asyncio.sleep(min_wait)
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@lru_cache(maxsize=128)
+def _parse_http_date(header_value: str) -> Optional[float]:
+    """Parse a Retry-After HTTP-date into an absolute POSIX timestamp.
+
+    Cached because rate-limited responses tend to repeat the same header.
+    The absolute time is cached rather than the wait, which changes as time
+    passes.
+
+    Args:
+        header_value: Stripped Retry-After header string.
+
+    Returns:
+        Timestamp of the retry time, or None if the date has no time zone.
+
+    Raises:
+        Any exception from ``parsedate_to_datetime`` for malformed dates.
+    """
+    retry_time = parsedate_to_datetime(header_value)
+    if retry_time.tzinfo is None:
+        return None
+    return retry_time.timestamp()
+
+
+def parse_retry_after(header_value: str, max_wait: float = _MAX_WAIT) -> float:
     """Parse a Retry-After header value into seconds to wait.
 
     Handles both formats:
@@ -42,28 +171,36 @@ def parse_retry_after(header_value: str) -> float:
 
     Args:
         header_value: Raw Retry-After header string.
+        max_wait: Upper bound on the returned wait (default: 300.0).
 
     Returns:
-        Number of seconds to wait (minimum 0.0, maximum 300.0).
+        Number of seconds to wait, between 0.0 and max_wait.
     """
     header_value = header_value.strip()
 
-    # Try integer seconds first
-    try:
-        seconds = float(header_value)
-        return max(0.0, min(seconds, 300.0))
-    except ValueError:
-        pass
+    # Integer seconds, the form RFC 7231 allows, need no exception handling
+    if header_value.isdecimal():
+        return min(float(header_value), max_wait)
+
+    # Other numbers (negative, fractional) are tolerated; HTTP-dates start
+    # with the day name, so skip the float() attempt for them
+    if not header_value[:1].isalpha():
+        try:
+            seconds = float(header_value)
+            return max(_MIN_WAIT, min(seconds, max_wait))
+        except ValueError:
+            pass
 
     # Try HTTP-date format
     try:
-        retry_time = parsedate_to_datetime(header_value)
-        now = datetime.now(tz=timezone.utc)
-        wait = (retry_time - now).total_seconds()
-        return max(0.0, min(wait, 300.0))
+        retry_timestamp = _parse_http_date(header_value)
     except Exception:
+        retry_timestamp = None
+    if retry_timestamp is None:
         # Cannot parse — return default 5 seconds
         return 5.0
+    wait = retry_timestamp - time.time()
+    return max(_MIN_WAIT, min(wait, max_wait))
 
 
 async def retry_with_backoff(
@@ -71,6 +208,8 @@ async def retry_with_backoff(
     *args,
     config: RetryConfig = DEFAULT_RETRY,
     retry_after_header: str = None,
+    limiter: Optional[HostTokenBucket] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
     **kwargs,
 ):
     """Retry an async callable with exponential backoff.
@@ -82,7 +221,16 @@ async def retry_with_backoff(
         coro_func: Async callable to retry.
         *args: Positional arguments to pass to coro_func.
         config: RetryConfig controlling retry behavior.
-        retry_after_header: If provided, used for first retry delay.
+        retry_after_header: If provided, used for the first retry delay when
+            the failed response carries no ``Retry-After`` header of its own.
+            Every retry honors the header of the response that failed.
+        limiter: Optional HostTokenBucket shared by the calls to one host. Each
+            retry then also waits for a token after its backoff delay.
+        semaphore: Optional semaphore held for the whole call, including the
+            waits between attempts, so requests sleeping before a retry still
+            count against the limit. Size it to the connection pool (e.g.
+            ``TCPConnector(limit_per_host=...)``) to keep retries from
+            outnumbering the connections available to serve them.
         **kwargs: Keyword arguments to pass to coro_func.
 
     Returns:
@@ -91,37 +239,51 @@ async def retry_with_backoff(
     Raises:
         The last exception if all retries are exhausted.
     """
-    import aiohttp
+    if semaphore is not None:
+        async with semaphore:
+            return await retry_with_backoff(
+                coro_func,
+                *args,
+                config=config,
+                retry_after_header=retry_after_header,
+                limiter=limiter,
+                **kwargs,
+            )
 
     last_exc = None
     for attempt in range(config.max_retries + 1):
         try:
             return await coro_func(*args, **kwargs)
-        except aiohttp.ClientResponseError as e:
-            if e.status not in config.retryable_status_codes:
+        except (aiohttp.ClientResponseError, asyncio.TimeoutError) as e:
+            # aiohttp.ServerTimeoutError is an asyncio.TimeoutError
+            response_error = isinstance(e, aiohttp.ClientResponseError)
+            if response_error and e.status not in config.retryable_status_codes:
                 raise  # Non-retryable HTTP error (401, 404, etc.)
             last_exc = e
             if attempt == config.max_retries:
                 break
-            # Use Retry-After if available (only on first attempt and if provided)
-            if attempt == 0 and retry_after_header:
-                delay = parse_retry_after(retry_after_header)
+            # The server's Retry-After, sent with any throttled response, wins
+            # over backoff and is not jittered. The explicit header argument
+            # only applies to the first retry.
+            header = None
+            if response_error and e.headers:
+                header = e.headers.get("Retry-After")
+            if not header and attempt == 0:
+                header = retry_after_header
+            if header:
+                delay = parse_retry_after(header, config.max_retry_after)
             else:
-                delay = min(config.base_delay * (2**attempt), config.max_delay)
-                if config.jitter:
-                    delay += random.uniform(0, delay * 0.1)
-            logger.warning(
-                f"Rate limited (attempt {attempt + 1}/{config.max_retries}), "
-                f"retrying in {delay:.1f}s..."
-            )
-            await asyncio.sleep(delay)
-        except asyncio.TimeoutError as e:
-            last_exc = e
-            if attempt == config.max_retries:
-                break
-            delay = min(config.base_delay * (2**attempt), config.max_delay)
-            if config.jitter:
-                delay += random.uniform(0, delay * 0.1)
-            await asyncio.sleep(delay)
+                delay = config.backoff_delay(attempt)
+            if response_error:
+                logger.warning(
+                    "Rate limited (attempt %d/%d), retrying in %.1fs...",
+                    attempt + 1,
+                    config.max_retries,
+                    delay,
+                )
+            if limiter is None:
+                await asyncio.sleep(delay)
+            else:
+                await limiter.acquire(min_wait=delay)
 
     raise last_exc
@@ -1,6 +1,8 @@
 """Tests for ADF node type parsing in MarkdownConverter."""
 
 import json
+from unittest.mock import patch
+
 import pytest
 
 from jarkdown.markdown_converter import MarkdownConverter
@@ -11,15 +13,26 @@ def converter():
     return MarkdownConverter("https://example.atlassian.net", "example.atlassian.net")
 
 
+@pytest.fixture(scope="session")
+def adf_table():
+    """ADF document with a 3x3 table, loaded once per session."""
+    with open("tests/data/adf_table.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def adf_task_decision():
+    """ADF document with a taskList and a decisionList, loaded once per session."""
+    with open("tests/data/adf_task_decision.json") as f:
+        return json.load(f)
+
+
 class TestAdfTable:
     """Tests for ADF table node parsing."""
 
-    def test_basic_table(self, converter):
+    def test_basic_table(self, converter, adf_table):
         """3x3 table renders with pipe delimiters and header separator."""
-        with open("tests/data/adf_table.json") as f:
-            adf = json.load(f)
-
-        result = converter._parse_adf_to_markdown(adf)
+        result = converter._parse_adf_to_markdown(adf_table)
 
         assert "| Name | Role | Status |" in result
         assert "| --- | --- | --- |" in result
@@ -294,30 +307,40 @@ class TestAdfInlineNodes:
 
         assert result == ""
 
+    def test_text_marks_nest_in_order(self, converter):
+        """The first mark wraps innermost; later marks wrap around it."""
+        adf = {
+            "type": "text",
+            "text": "x",
+            "marks": [
+                {"type": "code"},
+                {"type": "strong"},
+                {"type": "link", "attrs": {"href": "https://example.com"}},
+            ],
+        }
+
+        result = converter._parse_adf_to_markdown(adf)
+
+        assert result == "[**`x`**](https://example.com)"
+
 
 class TestAdfTaskDecision:
     """Tests for ADF taskList/decisionList parsing."""
 
-    def test_task_list_mixed(self, converter):
+    def test_task_list_mixed(self, converter, adf_task_decision):
         """TaskList with TODO and DONE items renders as checkboxes."""
-        with open("tests/data/adf_task_decision.json") as f:
-            adf = json.load(f)
-
         # Parse just the taskList (first content node)
-        task_list = adf["content"][0]
+        task_list = adf_task_decision["content"][0]
         result = converter._parse_adf_to_markdown(task_list)
 
         assert "- [x] Set up project structure" in result
         assert "- [ ] Write unit tests" in result
         assert "- [ ] Deploy to staging" in result
 
-    def test_decision_list(self, converter):
+    def test_decision_list(self, converter, adf_task_decision):
         """DecisionList renders as blockquoted decision items."""
-        with open("tests/data/adf_task_decision.json") as f:
-            adf = json.load(f)
-
         # Parse just the decisionList (second content node)
-        decision_list = adf["content"][1]
+        decision_list = adf_task_decision["content"][1]
         result = converter._parse_adf_to_markdown(decision_list)
 
         assert "> **Decision:** Use PostgreSQL for the database" in result
@@ -385,3 +408,32 @@ class TestAdfMediaGroup:
         result = converter._parse_adf_to_markdown(adf)
 
         assert result == ""
+
+
+class TestAdfRenderCache:
+    """Tests for reuse of rendered ADF nodes."""
+
+    def test_same_node_rendered_once(self, converter):
+        """A node rendered again returns the cached markdown without re-parsing."""
+        adf = {
+            "type": "doc",
+            "content": [{"type": "rule"}, {"type": "rule"}],
+        }
+        first = converter._parse_adf_to_markdown(adf)
+        with patch.object(MarkdownConverter, "_parse_adf_into") as mock_parse:
+            second = converter._parse_adf_to_markdown(adf)
+
+        assert first == second == "---\n\n---"
+        mock_parse.assert_not_called()
+
+    def test_cache_cleared_for_new_attachments(self, converter):
+        """Media is re-rendered once the issue's attachments change."""
+        adf = {"type": "media", "attrs": {"type": "file", "id": "10", "alt": "a.png"}}
+
+        assert converter._parse_adf_to_markdown(adf) == "![a.png](attachment)"
+
+        converter._prepare_attachment_lookup(
+            [{"attachment_id": "10", "filename": "a.png", "original_filename": "a.png"}]
+        )
+
+        assert converter._parse_adf_to_markdown(adf) == "![a.png](a.png)"
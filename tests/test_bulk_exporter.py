@@ -3,7 +3,7 @@
 import asyncio
 import re
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from aioresponses import aioresponses
@@ -17,13 +17,24 @@ from jarkdown.jira_api_client import JiraApiClient
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SEARCH_URL_RE = re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql")
+
+
+class _StubClient:
+    """Stand-in for an entered JiraApiClient when no call history is needed."""
+
+    __slots__ = ("domain", "base_url", "fetch_issue", "get_fields")
+
+    def __init__(self, domain):
+        self.domain = domain
+        self.base_url = f"https://{domain}"
+        self.fetch_issue = None
+        self.get_fields = None
+
 
 def _make_mock_client(domain="example.atlassian.net"):
-    """Return a minimal async mock JiraApiClient (already entered)."""
-    client = MagicMock()
-    client.domain = domain
-    client.base_url = f"https://{domain}"
-    return client
+    """Return a minimal stub JiraApiClient (already entered)."""
+    return _StubClient(domain)
 
 
 # ---------------------------------------------------------------------------
@@ -38,13 +49,19 @@ class TestBulkExporterInit:
         """Default concurrency is 3."""
         client = _make_mock_client()
         exporter = BulkExporter(client)
-        assert exporter.semaphore._value == 3
+        assert exporter.concurrency == 3
 
     def test_custom_concurrency(self):
-        """Custom concurrency sets semaphore value."""
+        """Custom concurrency sets the export limit."""
         client = _make_mock_client()
         exporter = BulkExporter(client, concurrency=5)
-        assert exporter.semaphore._value == 5
+        assert exporter.concurrency == 5
+
+    async def test_set_concurrency_rejects_zero(self):
+        """The export limit can't be lowered below one."""
+        exporter = BulkExporter(_make_mock_client())
+        with pytest.raises(ValueError):
+            await exporter.set_concurrency(0)
 
     def test_batch_name_creates_subdir(self, tmp_path):
         """batch_name is appended to output_dir."""
@@ -137,7 +154,7 @@ class TestExportBulk:
         assert len(failures) == 3
 
     async def test_semaphore_limits_concurrency(self, tmp_path):
-        """With concurrency=1, _do_export runs one at a time (semaphore in _export_one)."""
+        """With concurrency=1, _do_export runs one at a time."""
         client = _make_mock_client()
         exporter = BulkExporter(client, output_dir=tmp_path, concurrency=1)
 
@@ -159,6 +176,62 @@ class TestExportBulk:
         assert len(successes) == 5
         assert set(call_order) == set(keys)
 
+    async def test_pending_exports_not_started_early(self, tmp_path):
+        """Exports beyond the concurrency limit aren't created until a slot frees."""
+        exporter = BulkExporter(_make_mock_client(), output_dir=tmp_path, concurrency=2)
+        release = asyncio.Event()
+        started = []
+
+        async def blocking_export_one(key, n, total):
+            started.append(key)
+            await release.wait()
+            return ExportResult(issue_key=key, success=True)
+
+        async def check_then_release():
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert started == ["A-0", "A-1"]
+            release.set()
+
+        keys = [f"A-{n}" for n in range(10)]
+        with patch.object(exporter, "_export_one", side_effect=blocking_export_one):
+            (successes, failures), _ = await asyncio.gather(
+                exporter.export_bulk(keys), check_then_release()
+            )
+
+        assert [r.issue_key for r in successes] == keys
+
+    async def test_raising_concurrency_wakes_waiting_exports(self, tmp_path):
+        """set_concurrency lets queued exports start while others still run."""
+        client = _make_mock_client()
+        exporter = BulkExporter(client, output_dir=tmp_path, concurrency=1)
+        release = asyncio.Event()
+        active = []
+        peak = []
+
+        async def fake_do_export(key):
+            active.append(key)
+            peak.append(len(active))
+            await release.wait()
+            active.remove(key)
+            return ExportResult(issue_key=key, success=True)
+
+        async def widen_then_release():
+            while not active:
+                await asyncio.sleep(0)
+            await exporter.set_concurrency(3)
+            while len(active) < 3:
+                await asyncio.sleep(0)
+            release.set()
+
+        with patch.object(exporter, "_do_export", side_effect=fake_do_export):
+            (successes, failures), _ = await asyncio.gather(
+                exporter.export_bulk(["A-1", "A-2", "A-3"]), widen_then_release()
+            )
+
+        assert len(successes) == 3
+        assert max(peak) == 3
+
     async def test_unexpected_exception_becomes_failure(self, tmp_path):
         """Unexpected exception from gather treated as failure."""
         client = _make_mock_client()
@@ -176,6 +249,174 @@ class TestExportBulk:
         assert len(failures) == 1
         assert "Unexpected crash" in failures[0].error
 
+    async def test_failed_reexport_keeps_previous_markdown(self, tmp_path, monkeypatch):
+        """A compose failure leaves the last good {KEY}.md in place."""
+        monkeypatch.setattr(
+            "jarkdown.field_cache.user_config_dir", lambda _: str(tmp_path / "config")
+        )
+        client = _make_mock_client()
+
+        async def fetch_issue(key):
+            return {"key": key, "fields": {"summary": "First export"}}
+
+        async def get_fields():
+            return []
+
+        client.fetch_issue = fetch_issue
+        client.get_fields = get_fields
+        exporter = BulkExporter(client, output_dir=tmp_path / "out")
+        md_file = tmp_path / "out" / "PROJ-1" / "PROJ-1.md"
+
+        await exporter.export_bulk(["PROJ-1"])
+        previous = md_file.read_text(encoding="utf-8")
+        assert "First export" in previous
+
+        def failing_compose(self, stream, *args, **kwargs):
+            stream.write("# partial")
+            raise RuntimeError("compose failed")
+
+        with patch(
+            "jarkdown.export_core.MarkdownConverter.compose_markdown_into",
+            failing_compose,
+        ):
+            successes, failures = await exporter.export_bulk(["PROJ-1"])
+
+        assert [r.issue_key for r in failures] == ["PROJ-1"]
+        assert md_file.read_text(encoding="utf-8") == previous
+        assert not list(md_file.parent.glob("*.tmp"))
+
+
+class TestBulkExporterSession:
+    """Tests for connection reuse across a bulk export."""
+
+    async def test_bulk_run_uses_one_session(self, tmp_path, monkeypatch):
+        """Every issue in a bulk run is fetched through the client's one session."""
+        import aiohttp
+
+        monkeypatch.setattr(
+            "jarkdown.field_cache.user_config_dir", lambda _: str(tmp_path / "config")
+        )
+        keys = [f"PROJ-{n}" for n in range(1, 6)]
+
+        with aioresponses() as m, patch(
+            "jarkdown.jira_api_client.aiohttp.ClientSession",
+            wraps=aiohttp.ClientSession,
+        ) as session_cls:
+            m.get(
+                re.compile(r"https://example\.atlassian\.net/rest/api/3/field"),
+                payload=[],
+                repeat=True,
+            )
+            for key in keys:
+                m.get(
+                    re.compile(rf"https://example\.atlassian\.net/rest/api/3/issue/{key}\?"),
+                    payload={"key": key, "fields": {"summary": key}},
+                )
+            async with JiraApiClient(
+                "example.atlassian.net", "test@example.com", "test-token-123"
+            ) as client:
+                exporter = BulkExporter(client, output_dir=tmp_path / "out")
+                successes, failures = await exporter.export_bulk(keys)
+
+        assert len(successes) == 5
+        assert failures == []
+        session_cls.assert_called_once()
+
+
+class TestBulkExporterFieldMetadata:
+    """Tests for fetching field metadata once per bulk run."""
+
+    @pytest.mark.parametrize("refresh_fields", [False, True])
+    async def test_fields_fetched_once(self, tmp_path, monkeypatch, refresh_fields):
+        """With no cached metadata, or when forced, /field is requested once."""
+        monkeypatch.setattr(
+            "jarkdown.field_cache.user_config_dir", lambda _: str(tmp_path / "config")
+        )
+        keys = ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+        with aioresponses() as m:
+            m.get(
+                re.compile(r"https://example\.atlassian\.net/rest/api/3/field"),
+                payload=[{"id": "summary", "name": "Summary"}],
+                repeat=True,
+            )
+            for key in keys:
+                m.get(
+                    re.compile(rf"https://example\.atlassian\.net/rest/api/3/issue/{key}\?"),
+                    payload={"key": key, "fields": {"summary": key}},
+                )
+            async with JiraApiClient(
+                "example.atlassian.net", "test@example.com", "test-token-123"
+            ) as client:
+                exporter = BulkExporter(
+                    client, output_dir=tmp_path / "out", refresh_fields=refresh_fields
+                )
+                successes, _ = await exporter.export_bulk(keys)
+
+        field_requests = [
+            calls for (method, url), calls in m.requests.items() if url.path.endswith("/field")
+        ]
+        assert len(successes) == 3
+        assert sum(map(len, field_requests)) == 1
+
+    async def test_failed_fetch_cancels_field_refresh(self, tmp_path, monkeypatch):
+        """A failed issue fetch leaves no field refresh running behind it."""
+        monkeypatch.setattr(
+            "jarkdown.field_cache.user_config_dir", lambda _: str(tmp_path / "config")
+        )
+        fields_requested = asyncio.Event()
+        fields_cancelled = asyncio.Event()
+        client = _make_mock_client()
+
+        async def fetch_issue(key):
+            await fields_requested.wait()
+            raise IssueNotFoundError("not found")
+
+        async def get_fields():
+            fields_requested.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                fields_cancelled.set()
+                raise
+
+        client.fetch_issue = fetch_issue
+        client.get_fields = get_fields
+        exporter = BulkExporter(client, output_dir=tmp_path / "out")
+
+        successes, failures = await exporter.export_bulk(["PROJ-1"])
+
+        assert [r.issue_key for r in failures] == ["PROJ-1"]
+        assert fields_cancelled.is_set()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_field_refresh_overlaps_issue_fetch(self, tmp_path, monkeypatch):
+        """Field metadata is fetched while the issue request is still pending."""
+        monkeypatch.setattr(
+            "jarkdown.field_cache.user_config_dir", lambda _: str(tmp_path / "config")
+        )
+        fields_requested = asyncio.Event()
+        client = _make_mock_client()
+
+        async def fetch_issue(key):
+            # Only completes if the field request was made concurrently
+            await fields_requested.wait()
+            return {"key": key, "fields": {"summary": key}}
+
+        async def get_fields():
+            fields_requested.set()
+            return []
+
+        client.fetch_issue = fetch_issue
+        client.get_fields = get_fields
+        exporter = BulkExporter(client, output_dir=tmp_path / "out")
+
+        successes, failures = await asyncio.wait_for(
+            exporter.export_bulk(["PROJ-1"]), timeout=1
+        )
+
+        assert [r.issue_key for r in successes] == ["PROJ-1"]
+
 
 # ---------------------------------------------------------------------------
 # TestSearchJql
@@ -196,7 +437,7 @@ class TestSearchJql:
         """Returns all issues when no nextPageToken in response."""
         issues = [{"key": f"PROJ-{i}"} for i in range(3)]
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             payload={"issues": issues},
             status=200,
         )
@@ -215,12 +456,12 @@ class TestSearchJql:
         page2 = [{"key": f"PROJ-{i}"} for i in range(3, 5)]
 
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             payload={"issues": page1, "nextPageToken": "token-abc"},
             status=200,
         )
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             payload={"issues": page2},
             status=200,
         )
@@ -239,7 +480,7 @@ class TestSearchJql:
         """max_results=2 stops after collecting 2 issues even if API returns more."""
         issues = [{"key": f"PROJ-{i}"} for i in range(5)]
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             payload={"issues": issues},
             status=200,
         )
@@ -254,7 +495,7 @@ class TestSearchJql:
     async def test_empty_result(self, mock_api):
         """Empty issues list returns []."""
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             payload={"issues": []},
             status=200,
         )
@@ -271,7 +512,7 @@ class TestSearchJql:
         from jarkdown.exceptions import AuthenticationError
 
         mock_api.get(
-            re.compile(r"https://example\.atlassian\.net/rest/api/3/search/jql"),
+            _SEARCH_URL_RE,
             status=401,
         )
 
@@ -281,6 +522,83 @@ class TestSearchJql:
             with pytest.raises(AuthenticationError):
                 await client.search_jql("project = FOO", max_results=10)
 
+    async def test_rate_limited_page_is_retried(self, mock_api):
+        """A 429 page is retried after Retry-After and the results are kept."""
+        mock_api.get(_SEARCH_URL_RE, status=429, headers={"Retry-After": "0"})
+        mock_api.get(_SEARCH_URL_RE, payload={"issues": [{"key": "PROJ-1"}]})
+
+        async with JiraApiClient(
+            "example.atlassian.net", "test@example.com", "token"
+        ) as client:
+            result = await client.search_jql("project = PROJ", max_results=50)
+
+        assert result == [{"key": "PROJ-1"}]
+        assert sum(map(len, mock_api.requests.values())) == 2
+
+    async def test_iter_jql_yields_before_next_page(self, mock_api):
+        """iter_jql hands out the first page before requesting the second."""
+        mock_api.get(
+            _SEARCH_URL_RE, payload={"issues": [{"key": "PROJ-1"}], "nextPageToken": "t"}
+        )
+        mock_api.get(_SEARCH_URL_RE, payload={"issues": [{"key": "PROJ-2"}]})
+
+        async with JiraApiClient(
+            "example.atlassian.net", "test@example.com", "token"
+        ) as client:
+            pages_requested = []
+            async for issue in client.iter_jql("project = PROJ"):
+                pages_requested.append(sum(map(len, mock_api.requests.values())))
+
+        assert pages_requested == [1, 2]
+
+
+class TestExportStream:
+    """Tests for BulkExporter.export_stream."""
+
+    async def test_exports_every_streamed_key(self, tmp_path):
+        """Keys from an async iterable are exported and split by outcome."""
+        exporter = BulkExporter(_make_mock_client(), output_dir=tmp_path)
+
+        async def keys():
+            for key in ["PROJ-1", "PROJ-2", "PROJ-3"]:
+                yield key
+
+        async def fake_do_export(key):
+            if key == "PROJ-2":
+                raise IssueNotFoundError("not found")
+            return ExportResult(issue_key=key, success=True)
+
+        with patch.object(exporter, "_do_export", side_effect=fake_do_export):
+            successes, failures = await exporter.export_stream(keys())
+
+        assert [r.issue_key for r in successes] == ["PROJ-1", "PROJ-3"]
+        assert [r.issue_key for r in failures] == ["PROJ-2"]
+
+    async def test_search_error_cancels_started_exports(self, tmp_path):
+        """A failing key stream cancels exports it already started."""
+        exporter = BulkExporter(_make_mock_client(), output_dir=tmp_path)
+        started = asyncio.Event()
+        cancelled = []
+
+        async def keys():
+            yield "PROJ-1"
+            await started.wait()
+            raise JiraApiError("JQL search failed: HTTP 500")
+
+        async def slow_do_export(key):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(key)
+                raise
+
+        with patch.object(exporter, "_do_export", side_effect=slow_do_export):
+            with pytest.raises(JiraApiError):
+                await exporter.export_stream(keys())
+
+        assert cancelled == ["PROJ-1"]
+
 
 # ---------------------------------------------------------------------------
 # TestGenerateIndexMd
@@ -335,6 +653,19 @@ class TestGenerateIndexMd:
         assert index_file.exists()
         assert "# Export Summary" in index_file.read_text(encoding="utf-8")
 
+    async def test_written_file_matches_generated_content(self, tmp_path):
+        """The streamed index.md is identical to generate_index_md output."""
+        exporter = self._make_exporter(tmp_path)
+        results = [
+            ExportResult("PROJ-2", success=True),
+            ExportResult("PROJ-1", success=False, error="err"),
+        ]
+        issues_data = {"PROJ-2": {"fields": {"summary": "Second"}}}
+        await exporter.write_index_md(results, issues_data)
+
+        written = (tmp_path / "index.md").read_text(encoding="utf-8")
+        assert written == exporter.generate_index_md(results, issues_data)
+
     def test_sorted_by_key(self, tmp_path):
         """Rows are sorted by issue key regardless of input order."""
         exporter = self._make_exporter(tmp_path)
@@ -345,10 +676,8 @@ class TestGenerateIndexMd:
         ]
         content = exporter.generate_index_md(results, {})
 
-        proj1_pos = content.index("PROJ-1")
-        proj2_pos = content.index("PROJ-2")
-        proj3_pos = content.index("PROJ-3")
-        assert proj1_pos < proj2_pos < proj3_pos
+        row_keys = re.findall(r"^\| \[(PROJ-\d+)\]", content, re.MULTILINE)
+        assert row_keys == ["PROJ-1", "PROJ-2", "PROJ-3"]
 
     def test_issues_data_populates_columns(self, tmp_path):
         """Summary/status/type/assignee filled from all_issues_data when available."""
@@ -371,6 +700,27 @@ class TestGenerateIndexMd:
         assert "Bug" in content
         assert "Jane Doe" in content
 
+    def test_null_field_values_show_dashes(self, tmp_path):
+        """Null names in the issue data render as '-' rather than 'None'."""
+        exporter = self._make_exporter(tmp_path)
+        results = [ExportResult("PROJ-7", success=True)]
+        issues_data = {
+            "PROJ-7": {
+                "fields": {
+                    "summary": None,
+                    "status": {"name": None},
+                    "issuetype": {"name": ""},
+                    "assignee": {"displayName": None},
+                }
+            }
+        }
+        content = exporter.generate_index_md(results, issues_data)
+
+        row = next(line for line in content.splitlines() if "PROJ-7" in line)
+        assert "None" not in row
+        cols = [c.strip() for c in row.split(" | ")]
+        assert cols.count("-") == 4
+
     def test_missing_issues_data_shows_dashes(self, tmp_path):
         """Columns show '-' when issue data is absent."""
         exporter = self._make_exporter(tmp_path)
@@ -19,57 +19,117 @@ def mock_env():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def issue_with_attachments():
-    """Load mock issue data with attachments"""
+    """Load mock issue data with attachments, once per session"""
     with open("tests/data/issue_with_attachments.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def issue_no_description():
-    """Load mock issue data without description"""
+    """Load mock issue data without description, once per session"""
     with open("tests/data/issue_no_description.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def issue_no_attachments():
-    """Load mock issue data without attachments"""
+    """Load mock issue data without attachments, once per session"""
     with open("tests/data/issue_no_attachments.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def issue_with_comments():
-    """Load mock issue data with comments"""
+    """Load mock issue data with comments, once per session"""
     with open("tests/data/issue_with_comments.json") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def issue_with_adf_media():
-    """Load mock issue whose comments contain ADF media attachments"""
+    """Load mock issue whose comments contain ADF media attachments, once per session"""
     with open("tests/data/issue_with_adf_media.json") as f:
         return json.load(f)
 
 
-def _make_client_mock(issue_data, domain="example.atlassian.net"):
-    """Create mock class and instance for async JiraApiClient context manager.
+class _StubClient:
+    """Stand-in for an entered JiraApiClient that serves one issue."""
+
+    __slots__ = ("domain", "base_url", "_issue_data")
+
+    def __init__(self, issue_data, domain):
+        self.domain = domain
+        self.base_url = f"https://{domain}"
+        self._issue_data = issue_data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def fetch_issue(self, issue_key):
+        return self._issue_data
+
+    async def fetch_fields(self):
+        return []
+
+    async def get_fields(self):
+        return []
+
+
+@pytest.fixture
+def cli_cwd(tmp_path, monkeypatch):
+    """Run the test from tmp_path with an empty .env file.
+
+    Returns:
+        Path: The temporary working directory
+    """
+    (tmp_path / ".env").write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def patched_deps(monkeypatch):
+    """Replace the field cache and attachment handler used by single exports.
 
     Returns:
-        tuple: (mock_class, mock_instance) where mock_class replaces JiraApiClient
+        tuple: (field_cache, attachment_handler) mock instances; attachment
+            downloads return no files unless a test sets a side effect
     """
-    mock_client = AsyncMock()
-    mock_client.base_url = f"https://{domain}"
-    mock_client.domain = domain
-    mock_client.fetch_issue = AsyncMock(return_value=issue_data)
-    mock_client.fetch_fields = AsyncMock(return_value=[])
+    field_cache = MagicMock()
+    field_cache.is_stale.return_value = False
+    field_cache.load.return_value = []
+    field_cache.get_field_name.side_effect = lambda x: x
+    field_cache.get_field_schema.return_value = {}
+    monkeypatch.setattr(
+        "jarkdown.field_cache.FieldMetadataCache", MagicMock(return_value=field_cache)
+    )
+
+    attachment_handler = MagicMock()
+    attachment_handler.download_all_attachments = AsyncMock(return_value=[])
+    monkeypatch.setattr(
+        "jarkdown.export_core.AttachmentHandler",
+        MagicMock(return_value=attachment_handler),
+    )
+    return field_cache, attachment_handler
 
-    mock_class = MagicMock()
-    mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-    return mock_class, mock_client
+
+def _make_client_mock(issue_data, domain="example.atlassian.net"):
+    """Create mock class and stub instance for the JiraApiClient context manager.
+
+    The instance is a plain stub rather than an AsyncMock tree, which is slow
+    to build and unused by tests that only check the exported files.
+
+    Returns:
+        tuple: (mock_class, stub_client) where mock_class replaces JiraApiClient
+    """
+    stub_client = _StubClient(issue_data, domain)
+    mock_class = MagicMock(return_value=stub_client)
+    return mock_class, stub_client
 
 
 async def _fake_download_all(attachments, out_dir):
@@ -96,142 +156,101 @@ class TestCLI:
     """End-to-end tests for the CLI interface"""
 
     def test_successful_download_with_attachments(
-        self, mock_env, issue_with_attachments, tmp_path
+        self, mock_env, issue_with_attachments, cli_cwd, patched_deps
     ):
         """Verify successful download creates correct files"""
         mock_jira_class, _ = _make_client_mock(issue_with_attachments)
 
+        _, attachment_handler = patched_deps
+        attachment_handler.download_all_attachments.side_effect = _fake_download_all
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments.side_effect = (
-                    _fake_download_all
-                )
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
-                                main()
-
-                            assert os.path.exists("TEST-123")
-                            assert os.path.exists("TEST-123/TEST-123.md")
-                            assert os.path.exists("TEST-123/screenshot.png")
-                            assert os.path.exists("TEST-123/design_document.pdf")
-                            assert os.path.exists("TEST-123/diagram.jpg")
-                        finally:
-                            os.chdir(original_cwd)
+            with patch.dict(os.environ, mock_env):
+                with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
+                    main()
+
+                assert os.path.exists("TEST-123")
+                assert os.path.exists("TEST-123/TEST-123.md")
+                assert os.path.exists("TEST-123/screenshot.png")
+                assert os.path.exists("TEST-123/design_document.pdf")
+                assert os.path.exists("TEST-123/diagram.jpg")
 
     def test_markdown_content_correct(
-        self, mock_env, issue_with_attachments, tmp_path
+        self, mock_env, issue_with_attachments, cli_cwd, patched_deps
     ):
         """Verify markdown content is correct"""
         mock_jira_class, _ = _make_client_mock(issue_with_attachments)
 
+        _, attachment_handler = patched_deps
+        attachment_handler.download_all_attachments.side_effect = _fake_download_all
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments.side_effect = (
-                    _fake_download_all
+            with patch.dict(os.environ, mock_env):
+                with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
+                    main()
+
+                with open("TEST-123/TEST-123.md", "r") as f:
+                    content = f.read()
+
+                assert content.startswith("---\n")
+                assert "key: TEST-123" in content
+                assert "type: Task" in content
+                assert "status: To Do" in content
+                assert (
+                    "# [TEST-123](https://example.atlassian.net/browse/TEST-123): Test Issue with Attachments"
+                    in content
                 )
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
-                                main()
-
-                            with open("TEST-123/TEST-123.md", "r") as f:
-                                content = f.read()
-
-                            assert content.startswith("---\n")
-                            assert "key: TEST-123" in content
-                            assert "type: Task" in content
-                            assert "status: To Do" in content
-                            assert (
-                                "# [TEST-123](https://example.atlassian.net/browse/TEST-123): Test Issue with Attachments"
-                                in content
-                            )
-                            assert "## Description" in content
-                            assert "## Attachments" in content
-                        finally:
-                            os.chdir(original_cwd)
+                assert "## Description" in content
+                assert "## Attachments" in content
 
     def test_custom_output_directory(
-        self, mock_env, issue_no_attachments, tmp_path
+        self, mock_env, issue_no_attachments, tmp_path, cli_cwd, patched_deps
     ):
         """Verify --output flag works correctly"""
         mock_jira_class, _ = _make_client_mock(issue_no_attachments)
 
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments = AsyncMock(return_value=[])
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            custom_output = tmp_path / "custom_output"
-                            with patch(
-                                "sys.argv",
-                                ["jarkdown", "export", "TEST-789", "--output", str(custom_output)],
-                            ):
-                                main()
-
-                            assert os.path.exists(custom_output / "TEST-789")
-                            assert os.path.exists(custom_output / "TEST-789" / "TEST-789.md")
-                        finally:
-                            os.chdir(original_cwd)
-
-    def test_missing_environment_variables(self, tmp_path):
+            with patch.dict(os.environ, mock_env):
+                custom_output = tmp_path / "custom_output"
+                with patch(
+                    "sys.argv",
+                    ["jarkdown", "export", "TEST-789", "--output", str(custom_output)],
+                ):
+                    main()
+
+                assert os.path.exists(custom_output / "TEST-789")
+                assert os.path.exists(custom_output / "TEST-789" / "TEST-789.md")
+
+    def test_missing_environment_variables(self, cli_cwd):
         """Verify error when environment variables are missing"""
         clean_env = {k: v for k, v in os.environ.items() if not k.startswith("JIRA_")}
 
         with patch.dict(os.environ, clean_env, clear=True):
             with patch("jarkdown.jarkdown.load_dotenv"):
-                original_cwd = os.getcwd()
-                os.chdir(tmp_path)
-
-                with open(".env", "w") as f:
-                    f.write("")
-
-                try:
-                    with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
-                        with patch("sys.stdout", new=StringIO()) as mock_stdout:
-                            with pytest.raises(SystemExit) as exc_info:
-                                main()
+                with patch("sys.argv", ["jarkdown", "export", "TEST-123"]):
+                    with patch("sys.stdout", new=StringIO()) as mock_stdout:
+                        with pytest.raises(SystemExit) as exc_info:
+                            main()
 
-                            assert exc_info.value.code != 0
-                            stdout_output = mock_stdout.getvalue()
-                            assert "Missing required environment variables" in stdout_output
-                finally:
-                    os.chdir(original_cwd)
+                        assert exc_info.value.code != 0
+                        stdout_output = mock_stdout.getvalue()
+                        assert "Missing required environment variables" in stdout_output
+
+    def test_load_credentials_skips_dotenv_when_env_complete(self, mock_env, tmp_path, monkeypatch):
+        """.env is not read when all JIRA_* variables are already set"""
+        from jarkdown.jarkdown import _load_credentials
+
+        monkeypatch.chdir(tmp_path)
+        with patch.dict(os.environ, mock_env):
+            with patch("jarkdown.jarkdown.load_dotenv") as mock_load:
+                credentials = _load_credentials()
+
+        mock_load.assert_not_called()
+        assert credentials == (
+            mock_env["JIRA_DOMAIN"],
+            mock_env["JIRA_EMAIL"],
+            mock_env["JIRA_API_TOKEN"],
+        )
 
-    def test_invalid_issue_key_404(self, mock_env, tmp_path):
+    def test_invalid_issue_key_404(self, mock_env, cli_cwd):
         """Verify 404 error handling"""
         mock_client = AsyncMock()
         mock_client.base_url = "https://example.atlassian.net"
@@ -248,26 +267,17 @@ class TestCLI:
 
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
             with patch.dict(os.environ, mock_env):
-                original_cwd = os.getcwd()
-                os.chdir(tmp_path)
-
-                with open(".env", "w") as f:
-                    f.write("")
-
-                try:
-                    with patch("sys.argv", ["jarkdown", "export", "INVALID-999"]):
-                        with patch("sys.stderr", new=StringIO()) as mock_stderr:
-                            with pytest.raises(SystemExit) as exc_info:
-                                main()
-
-                            assert exc_info.value.code != 0
-                            stderr_output = mock_stderr.getvalue()
-                            assert (
-                                "not found" in stderr_output.lower()
-                                or "404" in stderr_output
-                            )
-                finally:
-                    os.chdir(original_cwd)
+                with patch("sys.argv", ["jarkdown", "export", "INVALID-999"]):
+                    with patch("sys.stderr", new=StringIO()) as mock_stderr:
+                        with pytest.raises(SystemExit) as exc_info:
+                            main()
+
+                        assert exc_info.value.code != 0
+                        stderr_output = mock_stderr.getvalue()
+                        assert (
+                            "not found" in stderr_output.lower()
+                            or "404" in stderr_output
+                        )
 
     def test_invalid_credentials_401(self):
         """Verify 401 authentication error"""
@@ -305,145 +315,98 @@ class TestCLI:
                             or "401" in stderr_output
                         )
 
-    def test_verbose_flag(self, mock_env, issue_no_description):
+    def test_verbose_flag(self, mock_env, issue_no_description, tmp_path, patched_deps):
         """Test verbose flag provides additional output"""
         mock_jira_class, _ = _make_client_mock(issue_no_description)
 
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments = AsyncMock(return_value=[])
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        with patch(
-                            "sys.argv", ["jarkdown", "export", "TEST-456", "--verbose"]
-                        ):
-                            # Verbose flag succeeds without raising SystemExit
-                            main()
+            with patch.dict(os.environ, mock_env):
+                with patch(
+                    "sys.argv",
+                    [
+                        "jarkdown",
+                        "export",
+                        "TEST-456",
+                        "--verbose",
+                        "--output",
+                        str(tmp_path),
+                    ],
+                ):
+                    # Verbose flag succeeds without raising SystemExit
+                    main()
 
     def test_successful_download_with_comments(
-        self, mock_env, issue_with_comments, tmp_path
+        self, mock_env, issue_with_comments, tmp_path, cli_cwd, patched_deps
     ):
         """Test successful download with comments section"""
         mock_jira_class, _ = _make_client_mock(issue_with_comments)
 
+        _, attachment_handler = patched_deps
+        attachment_handler.download_all_attachments.side_effect = _fake_download_all
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments.side_effect = (
-                    _fake_download_all
+            with patch.dict(os.environ, mock_env):
+                with patch(
+                    "sys.argv",
+                    ["jarkdown", "export", "TEST-456", "--output", str(tmp_path)],
+                ):
+                    main()
+
+                output_dir = tmp_path / "TEST-456"
+                md_file = output_dir / "TEST-456.md"
+
+                assert md_file.exists()
+                content = md_file.read_text()
+
+                assert "## Comments" in content
+                assert "**John Doe** - _2025-08-16 10:30 AM_" in content
+                assert "This is the first comment" in content
+                assert "**Jane Smith** - _2025-08-16 11:15 AM_" in content
+                assert "**Alice Developer** - _2025-08-16 02:45 PM_" in content
+                assert "---" in content
+                assert "![new_mockup.png](new_mockup.png)" in content
+                assert "/secure/attachment/" not in content.replace(
+                    "[TEST-456](https://example.atlassian.net/browse/TEST-456)", ""
                 )
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            with patch(
-                                "sys.argv",
-                                ["jarkdown", "export", "TEST-456", "--output", str(tmp_path)],
-                            ):
-                                main()
-
-                            output_dir = tmp_path / "TEST-456"
-                            md_file = output_dir / "TEST-456.md"
-
-                            assert md_file.exists()
-                            content = md_file.read_text()
-
-                            assert "## Comments" in content
-                            assert "**John Doe** - _2025-08-16 10:30 AM_" in content
-                            assert "This is the first comment" in content
-                            assert "**Jane Smith** - _2025-08-16 11:15 AM_" in content
-                            assert "**Alice Developer** - _2025-08-16 02:45 PM_" in content
-                            assert "---" in content
-                            assert "![new_mockup.png](new_mockup.png)" in content
-                            assert "/secure/attachment/" not in content.replace(
-                                "[TEST-456](https://example.atlassian.net/browse/TEST-456)", ""
-                            )
-                            assert "/attachment/content/" not in content
-                        finally:
-                            os.chdir(original_cwd)
+                assert "/attachment/content/" not in content
 
     def test_adf_comment_media_embeds_attachments(
-        self, mock_env, issue_with_adf_media, tmp_path
+        self, mock_env, issue_with_adf_media, tmp_path, cli_cwd, patched_deps
     ):
         """ADF-only comments should embed downloaded attachments instead of placeholder text."""
         mock_jira_class, _ = _make_client_mock(issue_with_adf_media)
 
+        _, attachment_handler = patched_deps
+        attachment_handler.download_all_attachments.side_effect = _fake_download_all
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments.side_effect = (
-                    _fake_download_all
-                )
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            with patch(
-                                "sys.argv",
-                                ["jarkdown", "export", "ADF-100", "--output", str(tmp_path)],
-                            ):
-                                main()
-
-                            output_dir = tmp_path / "ADF-100"
-                            md_file = output_dir / "ADF-100.md"
-                            assert md_file.exists()
-                            content = md_file.read_text()
-
-                            assert "![evidence.png](evidence.png)" in content
-                            assert "![attachment](attachment)" not in content
-                        finally:
-                            os.chdir(original_cwd)
+            with patch.dict(os.environ, mock_env):
+                with patch(
+                    "sys.argv",
+                    ["jarkdown", "export", "ADF-100", "--output", str(tmp_path)],
+                ):
+                    main()
+
+                output_dir = tmp_path / "ADF-100"
+                md_file = output_dir / "ADF-100.md"
+                assert md_file.exists()
+                content = md_file.read_text()
+
+                assert "![evidence.png](evidence.png)" in content
+                assert "![attachment](attachment)" not in content
 
     def test_backward_compat_bare_issue_key(
-        self, mock_env, issue_no_attachments, tmp_path
+        self, mock_env, issue_no_attachments, cli_cwd, patched_deps
     ):
         """jarkdown TEST-555 (no subcommand) works via backward-compat shim."""
         mock_jira_class, _ = _make_client_mock(issue_no_attachments)
 
         with patch("jarkdown.jarkdown.JiraApiClient", mock_jira_class):
-            with patch("jarkdown.export_core.AttachmentHandler") as mock_ah_class:
-                mock_ah_class.return_value.download_all_attachments = AsyncMock(return_value=[])
-                with patch("jarkdown.field_cache.FieldMetadataCache") as mock_fmc:
-                    mock_fmc.return_value.is_stale.return_value = False
-                    mock_fmc.return_value.load.return_value = []
-                    mock_fmc.return_value.get_field_name.side_effect = lambda x: x
-                    mock_fmc.return_value.get_field_schema.return_value = {}
-                    with patch.dict(os.environ, mock_env):
-                        original_cwd = os.getcwd()
-                        os.chdir(tmp_path)
-
-                        with open(".env", "w") as f:
-                            f.write("")
-
-                        try:
-                            # No "export" subcommand — shim injects it automatically
-                            with patch("sys.argv", ["jarkdown", "TEST-555"]):
-                                main()
-
-                            assert os.path.exists("TEST-555")
-                            assert os.path.exists("TEST-555/TEST-555.md")
-                        finally:
-                            os.chdir(original_cwd)
+            with patch.dict(os.environ, mock_env):
+                # No "export" subcommand — shim injects it automatically
+                with patch("sys.argv", ["jarkdown", "TEST-555"]):
+                    main()
+
+                assert os.path.exists("TEST-555")
+                assert os.path.exists("TEST-555/TEST-555.md")
 
     def test_bulk_subcommand_routes_to_handler(self):
         """bulk subcommand routes to _handle_bulk (real implementation)."""
@@ -489,3 +452,50 @@ class TestCLI:
             mock_query.assert_called_once()
             args = mock_query.call_args[0][0]
             assert args.max_results == 10
+
+    def test_negative_cache_ttl_rejected(self, capsys):
+        """--cache-ttl below 0 is a usage error."""
+        with patch("jarkdown.jarkdown._handle_export") as mock_export:
+            with patch(
+                "sys.argv", ["jarkdown", "export", "PROJ-1", "--cache-ttl", "-5"]
+            ):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+        assert exc_info.value.code == 2
+        assert "must be 0 or greater" in capsys.readouterr().err
+        mock_export.assert_not_called()
+
+    def test_cache_ttl_accepts_zero(self):
+        """--cache-ttl 0 is accepted and leaves the cache disabled."""
+        with patch("jarkdown.jarkdown._handle_export") as mock_export:
+            with patch(
+                "sys.argv", ["jarkdown", "export", "PROJ-1", "--cache-ttl", "0"]
+            ):
+                main()
+        assert mock_export.call_args[0][0].cache_ttl == 0
+
+    def test_run_async_uses_uvloop_when_available(self):
+        """_run_async delegates to uvloop.run when uvloop is importable."""
+        from jarkdown.jarkdown import _run_async
+
+        fake_uvloop = MagicMock()
+        fake_uvloop.run.return_value = "done"
+
+        async def _coro():
+            return "unused"
+
+        coro = _coro()
+        with patch("jarkdown.jarkdown.uvloop", fake_uvloop):
+            assert _run_async(coro) == "done"
+        fake_uvloop.run.assert_called_once_with(coro)
+        coro.close()
+
+    def test_run_async_falls_back_to_asyncio(self):
+        """_run_async uses asyncio.run when uvloop is not installed."""
+        from jarkdown.jarkdown import _run_async
+
+        async def _coro():
+            return 42
+
+        with patch("jarkdown.jarkdown.uvloop", None):
+            assert _run_async(_coro()) == 42
@@ -7,9 +7,9 @@ from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 from aioresponses import aioresponses
 
-from jarkdown.jira_api_client import JiraApiClient
+from jarkdown.jira_api_client import CONNECTIONS_PER_HOST, JiraApiClient
 from jarkdown.attachment_handler import AttachmentHandler
-from jarkdown.markdown_converter import MarkdownConverter
+from jarkdown.markdown_converter import MarkdownConverter, _dump_simple_yaml
 from jarkdown.exceptions import (
     JiraApiError,
     AuthenticationError,
@@ -18,6 +18,24 @@ from jarkdown.exceptions import (
 )
 
 
+def _chunks(*items):
+    """Build a side effect for iter_attachment yielding the given chunks.
+
+    An exception among the items is raised when the stream reaches it.
+    """
+
+    def _iter(content_url, **kwargs):
+        async def _gen():
+            for item in items:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        return _gen()
+
+    return _iter
+
+
 @pytest.fixture
 def mock_api():
     """Provide aioresponses mock context."""
@@ -75,6 +93,13 @@ class TestJiraApiClient:
         assert client.api_base == "https://example.atlassian.net/rest/api/3"
         assert client.session is None  # session not created until __aenter__
 
+    async def test_connections_capped_per_host(self):
+        """The session never opens more than CONNECTIONS_PER_HOST sockets to Jira."""
+        async with JiraApiClient(
+            "example.atlassian.net", "test@example.com", "test-token-123"
+        ) as client:
+            assert client.session.connector.limit_per_host == CONNECTIONS_PER_HOST
+
     async def test_successful_api_call(self, mock_api, issue_with_attachments):
         """Test successful API call returns JSON data"""
         # Use regex to match URL regardless of query param encoding
@@ -128,6 +153,19 @@ class TestJiraApiClient:
 
         assert exc_info.value.status_code == 500
 
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_rate_limited_then_success(self, mock_sleep, mock_api, issue_with_attachments):
+        """Test 429 response is retried honoring Retry-After"""
+        url = re.compile(r"https://example\.atlassian\.net/rest/api/3/issue/TEST-123")
+        mock_api.get(url, status=429, headers={"Retry-After": "2"})
+        mock_api.get(url, payload=issue_with_attachments, status=200)
+
+        async with JiraApiClient("example.atlassian.net", "test@example.com", "test-token-123") as client:
+            result = await client.fetch_issue("TEST-123")
+
+        assert result == issue_with_attachments
+        mock_sleep.assert_any_call(2.0)
+
     async def test_network_error(self):
         """Test network error raises JiraApiError"""
         import aiohttp
@@ -143,6 +181,17 @@ class TestJiraApiClient:
 
         assert "Network error" in str(exc_info.value)
 
+    async def test_iter_attachment_yields_body_in_chunks(self, mock_api):
+        """Test iter_attachment streams the body in chunks of the requested size"""
+        url = "https://example.atlassian.net/rest/api/3/attachment/content/123"
+        mock_api.get(url, body=b"abcdefghij", status=200)
+
+        async with JiraApiClient("example.atlassian.net", "test@example.com", "test-token-123") as client:
+            chunks = [c async for c in client.iter_attachment(url, chunk_size=4)]
+
+        assert b"".join(chunks) == b"abcdefghij"
+        assert all(len(c) <= 4 for c in chunks)
+
 
 class TestAttachmentHandler:
     """Tests for AttachmentHandler class"""
@@ -157,9 +206,7 @@ class TestAttachmentHandler:
         }
 
         mock_client = MagicMock()
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(return_value=b"fake_content")
-        mock_client.download_attachment_stream = AsyncMock(return_value=mock_response)
+        mock_client.iter_attachment = MagicMock(side_effect=_chunks(b"fake_content"))
 
         handler = AttachmentHandler(mock_client)
         result = await handler.download_attachment(attachment, tmp_path)
@@ -185,9 +232,7 @@ class TestAttachmentHandler:
         (tmp_path / "test.pdf").write_text("existing")
 
         mock_client = MagicMock()
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(return_value=b"new_content")
-        mock_client.download_attachment_stream = AsyncMock(return_value=mock_response)
+        mock_client.iter_attachment = MagicMock(side_effect=_chunks(b"new_content"))
 
         handler = AttachmentHandler(mock_client)
         result = await handler.download_attachment(attachment, tmp_path)
@@ -199,6 +244,94 @@ class TestAttachmentHandler:
         with open(tmp_path / "test_1.pdf", "rb") as f:
             assert f.read() == b"new_content"
 
+    @staticmethod
+    def _log_attachments():
+        """Two attachments sharing a name and size but not content."""
+        return [
+            {"id": "1", "filename": "log.txt", "content": "url1", "size": 4},
+            {"id": "2", "filename": "log.txt", "content": "url2", "size": 4},
+        ]
+
+    @staticmethod
+    def _client_serving(contents):
+        """Mock client streaming contents[content_url] for each attachment."""
+
+        def _iter(content_url, **kwargs):
+            async def _gen():
+                yield contents[content_url]
+
+            return _gen()
+
+        mock_client = MagicMock()
+        mock_client.iter_attachment = MagicMock(side_effect=_iter)
+        return mock_client
+
+    async def test_skip_existing_keeps_same_named_attachments_apart(self, tmp_path):
+        """Same-named, same-sized attachments are each downloaded on first export"""
+        mock_client = self._client_serving({"url1": b"AAAA", "url2": b"BBBB"})
+
+        handler = AttachmentHandler(mock_client, skip_existing=True)
+        results = await handler.download_all_attachments(
+            self._log_attachments(), tmp_path
+        )
+
+        assert [r["filename"] for r in results] == ["log.txt", "log_1.txt"]
+        assert (tmp_path / "log.txt").read_bytes() == b"AAAA"
+        assert (tmp_path / "log_1.txt").read_bytes() == b"BBBB"
+        assert mock_client.iter_attachment.call_count == 2
+
+    async def test_skip_existing_reexport_reuses_files(self, tmp_path):
+        """Re-exporting into the same directory downloads nothing new"""
+        contents = {"url1": b"AAAA", "url2": b"BBBB"}
+        first = AttachmentHandler(self._client_serving(contents), skip_existing=True)
+        await first.download_all_attachments(self._log_attachments(), tmp_path)
+
+        mock_client = self._client_serving(contents)
+        handler = AttachmentHandler(mock_client, skip_existing=True)
+        results = await handler.download_all_attachments(
+            self._log_attachments(), tmp_path
+        )
+
+        mock_client.iter_attachment.assert_not_called()
+        assert [r["filename"] for r in results] == ["log.txt", "log_1.txt"]
+        assert [r["attachment_id"] for r in results] == ["1", "2"]
+        assert sorted(p.name for p in tmp_path.glob("log*")) == [
+            "log.txt",
+            "log_1.txt",
+        ]
+
+    async def test_skip_existing_ignores_unrecorded_file(self, tmp_path):
+        """A same-named file not recorded for the attachment id is not reused"""
+        (tmp_path / "log.txt").write_bytes(b"XXXX")
+        mock_client = self._client_serving({"url1": b"AAAA"})
+
+        handler = AttachmentHandler(mock_client, skip_existing=True)
+        results = await handler.download_all_attachments(
+            self._log_attachments()[:1], tmp_path
+        )
+
+        assert results[0]["filename"] == "log_1.txt"
+        assert (tmp_path / "log_1.txt").read_bytes() == b"AAAA"
+        assert (tmp_path / "log.txt").read_bytes() == b"XXXX"
+
+    async def test_skip_existing_redownloads_incomplete_file_in_place(self, tmp_path):
+        """A recorded file whose size differs is downloaded again under its name"""
+        contents = {"url1": b"AAAA", "url2": b"BBBB"}
+        first = AttachmentHandler(self._client_serving(contents), skip_existing=True)
+        await first.download_all_attachments(self._log_attachments(), tmp_path)
+        (tmp_path / "log_1.txt").write_bytes(b"BB")
+
+        mock_client = self._client_serving(contents)
+        handler = AttachmentHandler(mock_client, skip_existing=True)
+        results = await handler.download_all_attachments(
+            self._log_attachments(), tmp_path
+        )
+
+        assert [r["filename"] for r in results] == ["log.txt", "log_1.txt"]
+        assert mock_client.iter_attachment.call_count == 1
+        assert (tmp_path / "log_1.txt").read_bytes() == b"BBBB"
+        assert not (tmp_path / "log_2.txt").exists()
+
     async def test_download_error_raises_exception(self, tmp_path):
         """Test download error raises AttachmentDownloadError"""
         attachment = {
@@ -209,8 +342,8 @@ class TestAttachmentHandler:
         }
 
         mock_client = MagicMock()
-        mock_client.download_attachment_stream = AsyncMock(
-            side_effect=Exception("Download failed")
+        mock_client.iter_attachment = MagicMock(
+            side_effect=_chunks(Exception("Download failed"))
         )
 
         handler = AttachmentHandler(mock_client)
@@ -219,6 +352,7 @@ class TestAttachmentHandler:
 
         assert "test.pdf" in str(exc_info.value)
         assert "Download failed" in str(exc_info.value)
+        assert not (tmp_path / "test.pdf").exists()
 
     async def test_multiple_attachments_download(self, tmp_path):
         """Test downloading multiple attachments"""
@@ -238,9 +372,7 @@ class TestAttachmentHandler:
         ]
 
         mock_client = MagicMock()
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(return_value=b"content")
-        mock_client.download_attachment_stream = AsyncMock(return_value=mock_response)
+        mock_client.iter_attachment = MagicMock(side_effect=_chunks(b"content"))
 
         handler = AttachmentHandler(mock_client)
         results = await handler.download_all_attachments(attachments, tmp_path)
@@ -356,6 +488,69 @@ class TestMarkdownConverter:
         assert "[Document](document.pdf)" in result
         assert "https://example.atlassian.net" not in result
 
+    def test_image_and_link_to_same_attachment_replaced(self, markdown_converter):
+        """Test an image and a link to the same attachment are both replaced"""
+        content = (
+            "![](https://example.atlassian.net/rest/api/3/attachment/content/10001) "
+            "[see file](https://example.atlassian.net/secure/attachment/10001/shot.png)"
+        )
+        attachments = [
+            {
+                "attachment_id": "10001",
+                "filename": "shot.png",
+                "original_filename": "shot.png",
+            }
+        ]
+
+        result = markdown_converter.replace_attachment_links(content, attachments)
+
+        assert result == "![](shot.png) [see file](shot.png)"
+
+    def test_relative_attachment_url_replacement(self, markdown_converter):
+        """Test attachment URLs without the domain are still replaced"""
+        content = "[Document](/secure/attachment/12345/document.pdf)"
+        attachments = [
+            {"filename": "document.pdf", "original_filename": "document.pdf"}
+        ]
+
+        result = markdown_converter.replace_attachment_links(content, attachments)
+
+        assert result == "[Document](document.pdf)"
+
+    def test_stray_bracket_before_image_link(self, markdown_converter):
+        """Test an unclosed "[" earlier in the text doesn't become part of the link"""
+        content = (
+            "see [ ![alt](https://example.atlassian.net/jira/rest/api/3/attachment/thumbnail/11)"
+        )
+        attachments = [{"filename": "shot.png", "original_filename": "shot.png"}]
+
+        result = markdown_converter.replace_attachment_links(content, attachments)
+
+        assert result == "see [ ![alt](alt)"
+
+    def test_stray_bracket_does_not_reach_next_comment(self, markdown_converter):
+        """Test an unclosed "[" in one comment leaves the next comment's link intact"""
+        issue_data = {
+            "fields": {
+                "comment": {
+                    "comments": [
+                        {"id": "1", "body": "see [ the notes"},
+                        {
+                            "id": "2",
+                            "body": "[log](https://example.atlassian.net"
+                            "/rest/api/3/attachment/content/99)",
+                        },
+                    ]
+                }
+            }
+        }
+        attachments = [{"filename": "shot.png", "original_filename": "shot.png"}]
+
+        section = markdown_converter._compose_comments_section(issue_data, attachments)
+
+        assert "see [ the notes" in section[0]
+        assert "[log](log)" in section[0]
+
     def test_multiple_url_patterns(self, markdown_converter):
         """Test various Jira URL patterns are replaced"""
         content = """
@@ -385,6 +580,36 @@ class TestMarkdownConverter:
         # Filename should be URL encoded in markdown
         assert "![Image](my%20file.png)" in result
 
+    def test_filename_with_unbalanced_parentheses(self, markdown_converter):
+        """Test secure URLs naming files with a lone "(" or ")" are replaced"""
+        content = (
+            "[notes](https://example.atlassian.net/secure/attachment/14/a)b.png) "
+            "![shot](/secure/attachment/15/a(b.png)"
+        )
+        attachments = [
+            {"filename": "a)b.png", "original_filename": "a)b.png"},
+            {"filename": "a(b.png", "original_filename": "a(b.png"},
+        ]
+
+        result = markdown_converter.replace_attachment_links(content, attachments)
+
+        assert result == "[notes](a%29b.png) ![shot](a%28b.png)"
+
+    def test_unknown_unbalanced_filename_keeps_next_link(self, markdown_converter):
+        """Test a non-downloaded "a(b.png" URL doesn't absorb the following link"""
+        content = (
+            "![x](/secure/attachment/1/a(b.png) [doc](/secure/attachment/2/doc.pdf) "
+            "(see [a)b](/secure/attachment/3/a)b.png))"
+        )
+        attachments = [{"filename": "doc.pdf", "original_filename": "doc.pdf"}]
+
+        result = markdown_converter.replace_attachment_links(content, attachments)
+
+        assert result == (
+            "![x](/secure/attachment/1/a(b.png) [doc](doc.pdf) "
+            "(see [a)b](/secure/attachment/3/a)b.png))"
+        )
+
     def test_no_attachments_content_unchanged(self, markdown_converter):
         """Test content unchanged when no attachments"""
         content = """
@@ -483,6 +708,29 @@ class TestMarkdownConverter:
         # Check no attachments section
         assert "## Attachments" not in result
 
+    def test_frontmatter_matches_yaml_dump(self):
+        """Hand-written frontmatter is byte-identical to yaml.dump output"""
+        metadata = {
+            "key": "TEST-1",
+            "summary": "Fix: the 'quoted' #thing",
+            "status": "In Progress",
+            "priority": None,
+            "labels": ["backend", "yes", "v1.0"],
+            "components": [],
+            "created_at": "2025-08-14T09:00:00.000+0000",
+            "duedate": "2025-06-15",
+            "resolution": "No",
+            "description_line": "x" * 90 + " wrapped",
+            "assignee": "Zoë Ünicode",
+            "progress": 0,
+        }
+
+        expected = yaml.dump(
+            metadata, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
+
+        assert _dump_simple_yaml(metadata) == expected
+
     def test_attachments_section_formatting(self, markdown_converter):
         """Test attachments section formatting"""
         issue_data = {
@@ -583,6 +831,39 @@ class TestMarkdownConverter:
         assert "/secure/attachment/" not in result
         assert "/attachment/content/" not in result
 
+    def test_compose_markdown_into_matches_compose_markdown(
+        self, markdown_converter, issue_with_comments
+    ):
+        """Test streaming composition writes the same text compose_markdown returns"""
+        import io
+
+        expected = markdown_converter.compose_markdown(issue_with_comments, [])
+        stream = io.StringIO()
+        markdown_converter.compose_markdown_into(stream, issue_with_comments, [])
+
+        assert stream.getvalue() == expected
+
+    def test_cache_output_reuses_unchanged_issue(self, issue_with_comments):
+        """Test cache_output skips recomposition until the issue is updated"""
+        converter = MarkdownConverter(
+            "https://example.atlassian.net", "example.atlassian.net", cache_output=True
+        )
+        first = converter.compose_markdown(issue_with_comments, [])
+
+        with patch.object(
+            MarkdownConverter,
+            "compose_markdown_into",
+            autospec=True,
+            side_effect=MarkdownConverter.compose_markdown_into,
+        ) as compose_into:
+            assert converter.compose_markdown(issue_with_comments, []) == first
+            compose_into.assert_not_called()
+
+            updated = json.loads(json.dumps(issue_with_comments))
+            updated["fields"]["updated"] = "2099-01-01T00:00:00.000+0000"
+            converter.compose_markdown(updated, [])
+            compose_into.assert_called_once()
+
     def test_issue_with_no_comments(self, markdown_converter):
         """Test issue with no comments doesn't include comments section"""
         issue_data = {
@@ -3,7 +3,7 @@
 import json
 import re
 import time
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
 import pytest
 from aioresponses import aioresponses
@@ -257,3 +257,14 @@ class TestFetchFields:
             async with JiraApiClient("example.atlassian.net", "test@example.com", "test-token-123") as client:
                 with pytest.raises(JiraApiError):
                     await client.fetch_fields()
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_fetch_fields_retries_on_503(self, mock_sleep, sample_fields):
+        """503 response is retried before succeeding."""
+        url = re.compile(r"https://example\.atlassian\.net/rest/api/3/field")
+        with aioresponses() as m:
+            m.get(url, status=503)
+            m.get(url, payload=sample_fields, status=200)
+            async with JiraApiClient("example.atlassian.net", "test@example.com", "test-token-123") as client:
+                result = await client.fetch_fields()
+        assert result == sample_fields
@@ -0,0 +1,127 @@
+"""Tests for the on-disk Jira response cache."""
+
+import json
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+from aioresponses import aioresponses
+
+from jarkdown.jira_api_client import JiraApiClient
+from jarkdown.response_cache import ResponseCache
+
+ISSUE_URL = re.compile(r"https://example\.atlassian\.net/rest/api/3/issue/TEST-1")
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Create a ResponseCache with a one-hour TTL in a temp cache dir."""
+    monkeypatch.setattr(
+        "jarkdown.response_cache.user_cache_dir", lambda _: str(tmp_path)
+    )
+    return ResponseCache("example.atlassian.net", "test@example.com", 3600)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage and expiry."""
+
+    def test_set_and_get(self, cache):
+        """A stored response is returned for the same key."""
+        key = cache.key("GET", "https://x/issue/TEST-1", {"fields": "*all"})
+        cache.set(key, {"key": "TEST-1"})
+
+        assert cache.get(key) == {"key": "TEST-1"}
+
+    def test_key_ignores_param_order(self, cache):
+        """Keys depend on the query parameters, not their order."""
+        first = cache.key("GET", "u", {"a": "1", "b": "2"})
+        second = cache.key("GET", "u", {"b": "2", "a": "1"})
+
+        assert first == second
+        assert first != cache.key("GET", "u", {"a": "1"})
+
+    def test_missing_entry(self, cache):
+        """Unknown keys return None."""
+        assert cache.get(cache.key("GET", "u")) is None
+
+    def test_expired_entry(self, cache):
+        """Responses older than the TTL are not reused."""
+        key = cache.key("GET", "u")
+        cache.set(key, {"key": "TEST-1"})
+        path = cache._path(key)
+        data = json.loads(path.read_text())
+        data["cached_at"] = time.time() - 3601
+        path.write_text(json.dumps(data))
+
+        assert cache.get(key) is None
+
+    def test_entries_are_per_account(self, cache):
+        """Another account on the same site doesn't see stored responses."""
+        key = cache.key("GET", "u")
+        cache.set(key, {"key": "TEST-1"})
+        other = ResponseCache("example.atlassian.net", "other@example.com", 3600)
+        same = ResponseCache("example.atlassian.net", "Test@Example.com", 3600)
+
+        assert other.get(key) is None
+        assert same.get(key) == {"key": "TEST-1"}
+
+    def test_set_leaves_no_temporary_files(self, cache):
+        """Entries are renamed into place, leaving only the final file."""
+        key = cache.key("GET", "u")
+        cache.set(key, {"key": "TEST-1"})
+        cache.set(key, {"key": "TEST-2"})
+
+        assert list(cache._path(key).parent.iterdir()) == [cache._path(key)]
+        assert cache.get(key) == {"key": "TEST-2"}
+
+    def test_failed_set_removes_temporary_file(self, cache):
+        """A failed rename is logged and leaves no temporary file behind."""
+        key = cache.key("GET", "u")
+        with patch(
+            "jarkdown.response_cache.os.replace", side_effect=OSError("disk full")
+        ):
+            cache.set(key, {"key": "TEST-1"})
+
+        assert list(cache._path(key).parent.iterdir()) == []
+        assert cache.get(key) is None
+
+    def test_corrupt_entry(self, cache):
+        """Unreadable cache files are treated as misses."""
+        key = cache.key("GET", "u")
+        cache.set(key, {"key": "TEST-1"})
+        cache._path(key).write_text("not valid json{{{")
+
+        assert cache.get(key) is None
+
+
+class TestFetchIssueCaching:
+    """Tests for JiraApiClient.fetch_issue with a response cache."""
+
+    async def test_second_fetch_served_from_cache(self, cache):
+        """Only the first fetch of an issue reaches Jira."""
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload={"key": "TEST-1"}, status=200)
+            async with JiraApiClient(
+                "example.atlassian.net",
+                "test@example.com",
+                "test-token-123",
+                response_cache=cache,
+            ) as client:
+                first = await client.fetch_issue("TEST-1")
+                # aioresponses would reject a second, unregistered request
+                second = await client.fetch_issue("TEST-1")
+
+        assert first == second == {"key": "TEST-1"}
+
+    async def test_no_cache_by_default(self):
+        """Without a cache every fetch requests the issue."""
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload={"key": "TEST-1"}, status=200, repeat=True)
+            async with JiraApiClient(
+                "example.atlassian.net", "test@example.com", "test-token-123"
+            ) as client:
+                await client.fetch_issue("TEST-1")
+                await client.fetch_issue("TEST-1")
+
+        assert len(next(iter(m.requests.values()))) == 2
@@ -3,9 +3,17 @@
 import asyncio
 import pytest
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from jarkdown.retry import RetryConfig, parse_retry_after, retry_with_backoff, DEFAULT_RETRY
+from jarkdown.retry import (
+    RetryConfig,
+    parse_retry_after,
+    retry_with_backoff,
+    DEFAULT_RETRY,
+    HostTokenBucket,
+    _parse_http_date,
+)
 
 
 class TestRetryConfig:
@@ -26,6 +34,28 @@ class TestRetryConfig:
         assert config.base_delay == 0.1
         assert config.max_delay == 60.0  # still default
 
+    def test_backoff_delay_doubles_up_to_cap(self):
+        """Backoff delays double per attempt and stop at max_delay."""
+        config = RetryConfig(max_retries=4, base_delay=1.0, max_delay=5.0, jitter=False)
+        assert [config.backoff_delay(attempt) for attempt in range(5)] == [
+            1.0,
+            2.0,
+            4.0,
+            5.0,
+            5.0,
+        ]
+
+    def test_jitter_bounds(self):
+        """Jitter adds up to 10%; full jitter picks anywhere below the delay."""
+        with patch("jarkdown.retry._random", return_value=0.5):
+            assert RetryConfig(base_delay=2.0).backoff_delay(0) == 2.1
+            assert RetryConfig(base_delay=2.0, full_jitter=True).backoff_delay(0) == 1.0
+
+    def test_config_is_frozen(self):
+        """Configs can't be changed after the delay schedule is computed."""
+        with pytest.raises(AttributeError):
+            DEFAULT_RETRY.max_retries = 10
+
     def test_retryable_status_codes_include_429(self):
         """429 Too Many Requests must be in retryable codes."""
         assert 429 in DEFAULT_RETRY.retryable_status_codes
@@ -34,6 +64,11 @@ class TestRetryConfig:
         """503 Service Unavailable must be in retryable codes."""
         assert 503 in DEFAULT_RETRY.retryable_status_codes
 
+    def test_custom_status_codes_stored_as_frozenset(self):
+        """Codes passed as a list or tuple are normalized to a frozenset."""
+        config = RetryConfig(retryable_status_codes=[429, 500])
+        assert config.retryable_status_codes == frozenset({429, 500})
+
 
 class TestParseRetryAfter:
     """Tests for parse_retry_after() helper."""
@@ -50,10 +85,19 @@ class TestParseRetryAfter:
         """Values over 300 are capped at 300.0."""
         assert parse_retry_after("999") == 300.0
 
+    def test_custom_cap(self):
+        """max_wait replaces the 300s cap for every header form."""
+        assert parse_retry_after("999", max_wait=600.0) == 600.0
+        assert parse_retry_after("12.5", max_wait=10.0) == 10.0
+
     def test_negative_clamped_to_zero(self):
         """Negative values are clamped to 0.0."""
         assert parse_retry_after("-5") == 0.0
 
+    def test_fractional_seconds(self):
+        """Non-integer seconds are still accepted."""
+        assert parse_retry_after(" 1.5 ") == 1.5
+
     def test_http_date_future(self):
         """HTTP-date 30 seconds in the future returns ≈30.0."""
         future = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
@@ -72,6 +116,24 @@ class TestParseRetryAfter:
         """Unparseable header value returns default of 5.0."""
         assert parse_retry_after("invalid garbage") == 5.0
 
+    def test_http_date_parsed_once(self):
+        """A repeated HTTP-date is parsed once; the wait still counts down."""
+        future = (datetime.now(tz=timezone.utc) + timedelta(seconds=60)).replace(microsecond=0)
+        header = future.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        _parse_http_date.cache_clear()
+
+        with patch(
+            "jarkdown.retry.parsedate_to_datetime", wraps=parsedate_to_datetime
+        ) as mock_parse, patch("jarkdown.retry.time.time") as mock_time:
+            mock_time.return_value = future.timestamp() - 40
+            first = parse_retry_after(header)
+            mock_time.return_value = future.timestamp() - 10
+            second = parse_retry_after(header)
+
+        assert first == 40.0
+        assert second == 10.0
+        mock_parse.assert_called_once()
+
 
 class TestRetryWithBackoff:
     """Tests for retry_with_backoff() async function."""
@@ -156,3 +218,133 @@ class TestRetryWithBackoff:
         assert result == "success"
         assert mock_func.call_count == 2
         assert mock_sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_server_timeout_honors_retry_after_argument(self, mock_sleep):
+        """Timeouts are retried too, and use an explicit Retry-After value."""
+        import aiohttp
+
+        mock_func = AsyncMock(side_effect=[aiohttp.ServerTimeoutError(), "success"])
+        config = RetryConfig(max_retries=3, base_delay=0.1, jitter=False)
+
+        result = await retry_with_backoff(mock_func, config=config, retry_after_header="7")
+
+        assert result == "success"
+        mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_after_from_response_headers(self, mock_sleep):
+        """Retry-After carried by the 429 response sets the first delay."""
+        import aiohttp
+
+        err_429 = aiohttp.ClientResponseError(
+            request_info=MagicMock(),
+            history=(),
+            status=429,
+            headers={"Retry-After": "7"},
+        )
+        mock_func = AsyncMock(side_effect=[err_429, "success"])
+        config = RetryConfig(max_retries=3, base_delay=0.1, jitter=False)
+
+        result = await retry_with_backoff(mock_func, config=config)
+
+        assert result == "success"
+        mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_after_honored_on_later_attempts(self, mock_sleep):
+        """Each throttled response's own Retry-After sets the delay after it."""
+        import aiohttp
+
+        def throttled(retry_after=None):
+            headers = {"Retry-After": retry_after} if retry_after else None
+            return aiohttp.ClientResponseError(
+                request_info=MagicMock(), history=(), status=429, headers=headers
+            )
+
+        mock_func = AsyncMock(
+            side_effect=[throttled(), throttled("9"), throttled(), "success"]
+        )
+        config = RetryConfig(max_retries=3, base_delay=0.1, jitter=False)
+
+        result = await retry_with_backoff(mock_func, config=config, retry_after_header="7")
+
+        assert result == "success"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [7.0, 9.0, 0.4]
+
+    @pytest.mark.asyncio
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_after_capped_by_config(self, mock_sleep):
+        """RetryConfig.max_retry_after bounds the server-requested wait."""
+        mock_func = AsyncMock(side_effect=[asyncio.TimeoutError(), "success"])
+        config = RetryConfig(max_retry_after=600.0, jitter=False)
+
+        await retry_with_backoff(mock_func, config=config, retry_after_header="900")
+
+        mock_sleep.assert_called_once_with(600.0)
+
+    @pytest.mark.asyncio
+    async def test_semaphore_held_while_waiting_to_retry(self):
+        """A call backing off keeps its slot; others wait until it finishes."""
+        semaphore = asyncio.Semaphore(1)
+        events = []
+
+        async def flaky():
+            events.append("flaky attempt")
+            if len(events) == 1:
+                raise asyncio.TimeoutError()
+            return "flaky"
+
+        async def steady():
+            events.append("steady attempt")
+            return "steady"
+
+        config = RetryConfig(max_retries=1, base_delay=0.01, jitter=False)
+        results = await asyncio.gather(
+            retry_with_backoff(flaky, config=config, semaphore=semaphore),
+            retry_with_backoff(steady, config=config, semaphore=semaphore),
+        )
+
+        assert results == ["flaky", "steady"]
+        assert events == ["flaky attempt", "flaky attempt", "steady attempt"]
+
+
+class TestHostTokenBucket:
+    """Tests for HostTokenBucket retry pacing."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_out_simultaneous_retries(self):
+        """Retries due at the same moment are let through one per 1/rate seconds."""
+        clock = [100.0]
+
+        async def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch("jarkdown.retry.time.monotonic", side_effect=lambda: clock[0]), patch(
+            "asyncio.sleep", side_effect=fake_sleep
+        ):
+            bucket = HostTokenBucket(rate=0.5)
+            released = []
+            for _ in range(3):
+                await bucket.acquire()
+                released.append(clock[0])
+
+        assert released == [100.0, 102.0, 104.0]
+
+    @pytest.mark.asyncio
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_waits_on_limiter(self, mock_sleep):
+        """retry_with_backoff hands its backoff delay to the limiter."""
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        mock_func = AsyncMock(side_effect=[asyncio.TimeoutError(), "success"])
+        config = RetryConfig(max_retries=3, base_delay=0.5, jitter=False)
+
+        result = await retry_with_backoff(mock_func, config=config, limiter=limiter)
+
+        assert result == "success"
+        limiter.acquire.assert_awaited_once_with(min_wait=0.5)
+        mock_sleep.assert_not_called()
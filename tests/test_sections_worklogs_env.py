@@ -167,6 +167,27 @@ class TestWorklogsSection:
 
         assert "| Test User | 2h | 2025-06-01 |  |" in text
 
+    def test_worklogs_comment_kept_on_one_row(self, converter):
+        """Pipes are escaped and newlines folded so the comment stays in its cell."""
+        issue_data = {
+            "fields": {
+                "worklog": {
+                    "worklogs": [
+                        {
+                            "author": {"displayName": "Test User"},
+                            "started": "2025-06-01T10:00:00.000+0000",
+                            "timeSpent": "1h",
+                            "timeSpentSeconds": 3600,
+                            "comment": "a | b\nc",
+                        }
+                    ],
+                }
+            }
+        }
+        lines = converter._compose_worklogs_section(issue_data)
+
+        assert "| Test User | 1h | 2025-06-01 | a \\| b c |" in lines
+
 
 class TestAdfToPlainText:
     """Tests for _adf_to_plain_text."""
@@ -0,0 +1,125 @@
+"""Tests for the HTML-to-Markdown conversion paths."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from markdownify import markdownify as md
+
+from jarkdown import markdown_converter
+from jarkdown.markdown_converter import MarkdownConverter, _convert_html_cached
+from jarkdown.simple_html import convert_simple_html
+
+
+@pytest.fixture
+def converter():
+    return MarkdownConverter("https://example.atlassian.net", "example.atlassian.net")
+
+
+@pytest.fixture(autouse=True)
+def clear_conversion_cache():
+    """Keep conversions cached by earlier tests from bypassing the mocks."""
+    _convert_html_cached.cache_clear()
+    yield
+    _convert_html_cached.cache_clear()
+
+
+class TestConvertSimpleHtml:
+    """Tests for convert_simple_html."""
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<p>Looks good to me.</p>",
+            "<p>First</p>\n<p>Second, with <strong>bold</strong> and <em>italics</em></p>",
+            "<p>Run <code>make test</code> before merging</p>",
+            '<p>See <a href="https://example.com/pr/1" class="external-link" '
+            'rel="nofollow">the PR</a> &amp; reply</p>',
+            "<p>1. not a list, # not a heading</p>",
+        ],
+    )
+    def test_matches_markdownify(self, html):
+        """Supported HTML converts exactly as markdownify would."""
+        expected = md(html, heading_style="ATX", bullets="*-+").strip()
+
+        assert convert_simple_html(html) == expected
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<ul><li>item</li></ul>",
+            '<p><img src="a.png"></p>',
+            "<p>snake_case and 2*3</p>",
+            "<p><strong><em>nested</em></strong></p>",
+            "<p><strong> spaced </strong></p>",
+            '<p><a href="https://example.com" title="t">link</a></p>',
+            '<p><a href="https://example.com">https://example.com</a></p>',
+            "<p>line<br>break</p>",
+            "<p>unclosed",
+            "bare text",
+        ],
+    )
+    def test_unsupported_returns_none(self, html):
+        """Anything outside the plain-paragraph subset is left to markdownify."""
+        assert convert_simple_html(html) is None
+
+    def test_converter_skips_markdownify_for_plain_paragraphs(self, converter):
+        """convert_html_to_markdown only calls markdownify when needed."""
+        with patch("markdownify.markdownify") as mock_md:
+            result = converter.convert_html_to_markdown("<p>Plain <b>text</b></p>")
+
+        assert result == "Plain **text**"
+        mock_md.assert_not_called()
+
+    def test_repeated_fragment_converted_once(self, converter):
+        """Identical short fragments are converted once and then reused."""
+        html = "<ul><li>Thanks,</li><li>The release team</li></ul>"
+        # Count calls on whichever backend _convert_html picks in this environment
+        if markdown_converter._html_to_markdown is not None:
+            backend = patch(
+                "jarkdown.markdown_converter._html_to_markdown",
+                wraps=markdown_converter._html_to_markdown,
+            )
+        else:
+            import markdownify
+
+            backend = patch("markdownify.markdownify", wraps=markdownify.markdownify)
+
+        with backend as mock_backend:
+            first = converter.convert_html_to_markdown(html)
+            second = converter.convert_html_to_markdown(html)
+
+        assert first == second
+        assert "* Thanks," in first
+        mock_backend.assert_called_once()
+
+    def test_converter_falls_back_for_lists(self, converter):
+        """Lists still go through markdownify."""
+        result = converter.convert_html_to_markdown("<ul><li>one</li><li>two</li></ul>")
+
+        assert "* one" in result
+        assert "* two" in result
+
+
+class TestHtmlBackend:
+    """Tests for the choice between html-to-markdown and markdownify."""
+
+    def test_uses_html_to_markdown_when_available(self, converter):
+        """The Rust converter replaces markdownify when it is importable."""
+        fake_convert = MagicMock()
+        fake_convert.return_value.content = "* one\n\n\n\n* two\n"
+
+        with patch("jarkdown.markdown_converter._html_to_markdown", fake_convert), patch(
+            "jarkdown.markdown_converter._HTML_TO_MARKDOWN_OPTIONS", "options", create=True
+        ), patch("markdownify.markdownify") as mock_md:
+            result = converter.convert_html_to_markdown("<ul><li>one</li><li>two</li></ul>")
+
+        assert result == "* one\n\n* two"
+        fake_convert.assert_called_once_with("<ul><li>one</li><li>two</li></ul>", "options")
+        mock_md.assert_not_called()
+
+    def test_falls_back_to_markdownify(self, converter):
+        """markdownify is used when html-to-markdown is not installed."""
+        with patch("jarkdown.markdown_converter._html_to_markdown", None):
+            result = converter.convert_html_to_markdown("<h2>Title</h2>")
+
+        assert result == "## Title"